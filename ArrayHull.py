@@ -0,0 +1,261 @@
+from functools import cmp_to_key
+
+import numpy as np
+
+from ConvexHull import KEY_TOLERANCE
+from Predicates import orient, orient_arrays
+
+# Array counterparts of the ConvexHull algorithms. Inputs are (N, 2) float64
+# arrays and results are indices into that array, in the same order as the
+# ConvexHull functions: counter-clockwise, starting at the lexicographically
+# smallest point, without duplicates or collinear edge points.
+
+
+def as_point_array(points):
+    pts = np.ascontiguousarray(points, dtype=np.float64)
+    if pts.ndim != 2 or pts.shape[1] != 2:
+        raise ValueError("points must be an (N, 2) array, got shape %r" % (pts.shape,))
+    return pts
+
+
+def cross(o, a, b):
+    # Row-wise cross product of o -> a and o -> b, broadcasting over arrays,
+    # with exact signs
+    return orient_arrays(o[..., 0], o[..., 1], a[..., 0], a[..., 1], b[..., 0], b[..., 1])
+
+
+def lexsort_unique(pts):
+    # Indices of the distinct points sorted by x, then y. Duplicates can only
+    # occur when x ties, and lexsort is stable, so the first occurrence of a
+    # duplicate is the one kept.
+    order = np.argsort(pts[:, 0])
+    if len(order) < 2:
+        return order
+    xs = pts[order, 0]
+    if not np.any(xs[1:] == xs[:-1]):
+        return order
+    # Only pay for the two-key sort and the duplicate check when some
+    # x-coordinates tie
+    order = np.lexsort((pts[:, 1], pts[:, 0]))
+    sorted_pts = pts[order]
+    keep = np.empty(len(order), dtype=bool)
+    keep[0] = True
+    np.any(sorted_pts[1:] != sorted_pts[:-1], axis=1, out=keep[1:])
+    return order[keep]
+
+
+def akl_toussaint_mask(points):
+    # Keep every point that is not strictly inside the octagon spanned by the
+    # extreme points in the x, y, x + y and x - y directions
+    pts = as_point_array(points)
+    keep = np.ones(len(pts), dtype=bool)
+    if len(pts) < 9:
+        return keep
+
+    xs, ys = pts[:, 0], pts[:, 1]
+    sums, diffs = xs + ys, xs - ys
+    # Extreme points in counter-clockwise order, starting from the leftmost
+    extremes = [
+        np.argmin(xs), np.argmin(sums), np.argmin(ys), np.argmax(diffs),
+        np.argmax(xs), np.argmax(sums), np.argmax(ys), np.argmin(diffs),
+    ]
+    octagon = []
+    for i in extremes:
+        if not octagon or np.any(pts[i] != octagon[-1]):
+            octagon.append(pts[i])
+    if len(octagon) > 1 and np.all(octagon[0] == octagon[-1]):
+        octagon.pop()
+    if len(octagon) < 3:
+        return keep
+
+    inside = np.ones(len(pts), dtype=bool)
+    for a, b in zip(octagon, octagon[1:] + octagon[:1]):
+        inside &= cross(a, b, pts) > 0
+    return ~inside
+
+
+def akl_toussaint_indices(points):
+    return np.flatnonzero(akl_toussaint_mask(points))
+
+
+def _prune_chain(pts, chain):
+    # A point that does not turn left with its neighbours in the sorted chain
+    # cannot be a vertex of that chain, so drop all such points at once and
+    # repeat while a pass still removes a meaningful share of the candidates.
+    while len(chain) > 3:
+        # Separate contiguous columns are about twice as fast as rows of pts
+        xs, ys = pts[chain, 0], pts[chain, 1]
+        turns_left = orient_arrays(xs[:-2], ys[:-2], xs[1:-1], ys[1:-1], xs[2:], ys[2:]) > 0
+        removed = len(turns_left) - np.count_nonzero(turns_left)
+        if removed == 0:
+            break
+        keep = np.ones(len(chain), dtype=bool)
+        keep[1:-1] = turns_left
+        chain = chain[keep]
+        if removed < len(chain) // 8:
+            break
+    return chain
+
+
+def _walk_chain(pts, chain):
+    hull = []
+    stack = []
+    for i, p in zip(chain.tolist(), pts[chain].tolist()):
+        while len(stack) >= 2 and orient(stack[-2], stack[-1], p) <= 0:
+            hull.pop()
+            stack.pop()
+        hull.append(i)
+        stack.append(p)
+    return hull
+
+
+def monotone_chain_indices(points, prefilter=False):
+    pts = as_point_array(points)
+    if prefilter:
+        candidates = akl_toussaint_indices(pts)
+        return candidates[monotone_chain_indices(pts[candidates])]
+
+    order = lexsort_unique(pts)
+    if len(order) < 3:
+        return order
+
+    # Split around the line through the extreme points: the lower chain only
+    # needs points on or below it, the upper chain points on or above it
+    first, last = pts[order[0]], pts[order[-1]]
+    side = orient_arrays(first[0], first[1], last[0], last[1], pts[order, 0], pts[order, 1])
+    lower = order[side <= 0]
+    upper = order[side >= 0][::-1]
+
+    lower_hull = _walk_chain(pts, _prune_chain(pts, lower))
+    upper_hull = _walk_chain(pts, _prune_chain(pts, upper))
+    return np.array(lower_hull[:-1] + upper_hull[:-1], dtype=np.intp)
+
+
+def monotone_chain(points, prefilter=False):
+    pts = as_point_array(points)
+    return pts[monotone_chain_indices(pts, prefilter)]
+
+
+# Elements of the (candidates, points) orientation block tested at once
+BRUTE_FORCE_BLOCK = 1 << 20
+
+
+def brute_force_indices(points, prefilter=False):
+    # The brute force edge test of ConvexHull.brute_force_convex_hull, with
+    # a block of candidate edges p -> q tested against every point in one
+    # NumPy operation. As there, only edges out of known hull vertices are
+    # tried, following the hull from its smallest point, and points strictly
+    # inside the Akl-Toussaint octagon are never tried as q.
+    pts = as_point_array(points)
+    if prefilter:
+        candidates = akl_toussaint_indices(pts)
+        return candidates[brute_force_indices(pts[candidates])]
+
+    order = lexsort_unique(pts)
+    if len(order) < 3:
+        return order
+    upts = pts[order]
+    ends = np.flatnonzero(akl_toussaint_mask(upts))
+    block = max(1, BRUTE_FORCE_BLOCK // len(upts))
+
+    hull = [0]
+    p = 0
+    while True:
+        o = upts[p]
+        for start in range(0, len(ends), block):
+            q = upts[ends[start:start + block], None, :]
+            c = cross(o, q, upts)
+            bad = (c < 0).any(axis=1)
+            # Points on the line p -> q must lie on the segment. This also
+            # rejects p -> p, as the other points are off its "segment".
+            i, j = np.nonzero(c == 0)
+            a, r = q[i, 0], upts[j]
+            off = ~((np.minimum(o, a) <= r) & (r <= np.maximum(o, a))).all(axis=1)
+            bad[i[off]] = True
+            found = np.flatnonzero(~bad)
+            if len(found):
+                p = ends[start + found[0]]
+                break
+        if p == 0:
+            return order[np.array(hull, dtype=np.intp)]
+        hull.append(p)
+
+
+def brute_force(points, prefilter=False):
+    pts = as_point_array(points)
+    return pts[brute_force_indices(pts, prefilter)]
+
+
+def _polar_order(pts, chain, pivot):
+    # chain sorted counter-clockwise around pivot, its lowest (then leftmost)
+    # point, nearest first on ties. As in ConvexHull._polar_sorted the key is
+    # -dx / dy, and the rare runs of nearly equal keys whose points are not
+    # collinear with the pivot are put in order with exact cross products.
+    dx = pts[chain, 0] - pivot[0]
+    dy = pts[chain, 1] - pivot[1]
+    keys = np.divide(-dx, dy, out=np.full(len(chain), -np.inf), where=dy != 0)
+    s = np.argsort(keys)
+    chain, keys = chain[s], keys[s]
+
+    equal = keys[1:] == keys[:-1]
+    with np.errstate(invalid="ignore"):
+        # -inf - -inf is nan, but those keys already count as equal
+        near = equal | (keys[1:] - keys[:-1] <= KEY_TOLERANCE * np.abs(keys[1:]))
+    if not near.any():
+        return chain
+    if equal.any():
+        # Only pay for the distance tiebreak when some keys tie. No ray from
+        # the pivot points below it, so along one the farther point has the
+        # larger y, or the larger x on the horizontal ray; comparing those
+        # is exact where squared distances could underflow.
+        s = np.lexsort((pts[chain, 0], pts[chain, 1], keys))
+        chain, keys = chain[s], keys[s]
+    tied = np.flatnonzero(near)
+    skew = ~equal[tied] | (cross(pivot, pts[chain[tied]], pts[chain[tied + 1]]) != 0)
+
+    o = tuple(pivot.tolist())
+
+    def compare(i, j):
+        c = orient(o, tuple(pts[i].tolist()), tuple(pts[j].tolist()))
+        if c:
+            return -1 if c > 0 else 1
+        di, dj = pts[i].tolist()[::-1], pts[j].tolist()[::-1]
+        return (di > dj) - (di < dj)
+
+    hi = 0
+    for i in tied[skew]:
+        if i < hi:
+            continue
+        # Widen to the whole run of nearly equal keys and sort it exactly
+        lo, hi = i, i + 2
+        while lo > 0 and near[lo - 1]:
+            lo -= 1
+        while hi < len(keys) and near[hi - 1]:
+            hi += 1
+        chain[lo:hi] = sorted(chain[lo:hi].tolist(), key=cmp_to_key(compare))
+    return chain
+
+
+def graham_scan_indices(points, prefilter=False):
+    pts = as_point_array(points)
+    if prefilter:
+        candidates = akl_toussaint_indices(pts)
+        return candidates[graham_scan_indices(pts[candidates])]
+
+    order = lexsort_unique(pts)
+    if len(order) < 3:
+        return order
+
+    # order is sorted by x, so the first of the lowest points is the pivot
+    ys = pts[order, 1]
+    pivot = pts[order[np.flatnonzero(ys == ys.min())[0]]]
+    chain = _polar_order(pts, order, pivot)
+
+    hull = np.array(_walk_chain(pts, _prune_chain(pts, chain)), dtype=np.intp)
+    start = np.lexsort((pts[hull, 1], pts[hull, 0]))[0]
+    return np.concatenate((hull[start:], hull[:start]))
+
+
+def graham_scan(points, prefilter=False):
+    pts = as_point_array(points)
+    return pts[graham_scan_indices(pts, prefilter)]
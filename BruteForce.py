@@ -1,90 +1,148 @@
 import tkinter as tk
-
-def brute_force_convex_hull(points):
-    if len(points) < 3:
-        return points
-
-    def on_the_left(p1, p2, p3):
-        return (p2[0] - p1[0]) * (p3[1] - p1[1]) - (p2[1] - p1[1]) * (p3[0] - p1[0]) > 0
-
-    hull = []
-    non_hull = []
-    for i in range(len(points)):
-        for j in range(len(points)):
-            if i != j:
-                left_side = True
-                for k in range(len(points)):
-                    if k != i and k != j:
-                        if not on_the_left(points[i], points[j], points[k]):
-                            left_side = False
-                            break
-                if left_side:
-                    hull.append((points[i], points[j]))
-                else:
-                    non_hull.append((points[i], points[j]))
-    return hull, non_hull
-
-def on_canvas_click(event):
-    x, y = event.x, event.y
-    points.append((x, y))
-    draw_point(x, y)
-
-def draw_point(x, y):
-    canvas.create_oval(x - 2, y - 2, x + 2, y + 2, fill='white', outline='white')
-
-def draw_hull_lines(lines, color):
-    for line in lines:
-        canvas.create_line(line[0], line[1], tags='line', fill=color, width=2)
-        canvas.update()
-        canvas.after(250)
-
-def draw_hull(hull, non_hull):
-    canvas.delete('line')
-    draw_hull_lines(non_hull, 'black')
-    draw_hull_lines(hull, 'red')
-
-def draw_axes():
-    # Draw x-axis
-    canvas.create_line(50, 350, 550, 350, tags='axis', fill='gray', width=2)
-    for i in range(11):
-        x = 50 + i * 50
-        canvas.create_line(x, 345, x, 355, tags='axis', fill='gray', width=2)
-        canvas.create_text(x, 370, text=str(i), anchor=tk.N, tags='axis', fill='white', font=("Arial", 10, "bold"))
-
-    # Draw y-axis
-    canvas.create_line(50, 350, 50, 20, tags='axis', fill='gray', width=2)
-    for i in range(11):
-        y = 350 - i * 30
-        canvas.create_line(45, y, 55, y, tags='axis', fill='gray', width=2)
-        canvas.create_text(40, y, text=str(i), anchor=tk.E, tags='axis', fill='white', font=("Arial", 10, "bold"))
-
-def reset_graph():
-    global points
-    canvas.delete('all')
-    draw_axes()
-    points = []
-
-def calculate_hull():
-    hull, non_hull = brute_force_convex_hull(points)
-    draw_hull(hull, non_hull)
-
-root = tk.Tk()
-root.title("Convex Hull - Brute Force")
-root.configure(bg='lightgrey')  # Set background color
-
-canvas = tk.Canvas(root, width=600, height=400, bg="#001F3F")
-canvas.pack()
-canvas.bind('<Button-1>', on_canvas_click)
-
-calculate_button = tk.Button(root, text="Calculate Convex Hull", command=calculate_hull, bg='navy', fg='white', font=("Arial", 12, "bold"))
-calculate_button.pack()
-
-reset_button = tk.Button(root, text="Reset Graph", command=reset_graph, bg='firebrick', fg='white', font=("Arial", 12, "bold"))
-reset_button.pack()
-
-points = []
-
-# Draw x and y axes
-draw_axes()
-
-root.mainloop()
+import Registry
+from ConvexHull import HullStats, brute_force_edges, brute_force_steps
+from HullApp import LivePoints
+from PointPanel import PointPanel, point_tuples
+from StepPlayer import CanvasRenderer, StepPlayer
+
+WIDTH, HEIGHT = 600, 400
+BACKGROUND = "#001F3F"
+# Every candidate edge is animated, so larger inputs only show the final hull
+ANIMATE_LIMIT = 50
+
+def brute_force_convex_hull(points, prefilter=False, stats=None, visualize=False):
+    return brute_force_edges(points, prefilter=prefilter, stats=stats, visualize=visualize)
+
+class BruteForceApp(LivePoints):
+    animate_limit = ANIMATE_LIMIT
+    array_hull_name = "brute_force_indices"
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Convex Hull - Brute Force")
+        self.root.configure(bg='lightgrey')  # Set background color
+
+        self.canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, bg=BACKGROUND)
+        self.canvas.pack()
+        self.canvas.bind('<Button-1>', self.on_canvas_click)
+
+        self.calculate_button = tk.Button(root, text="Calculate Convex Hull", command=self.calculate_hull, bg='navy', fg='white', font=("Arial", 12, "bold"))
+        self.calculate_button.pack()
+
+        self.reset_button = tk.Button(root, text="Reset Graph", command=self.reset_graph, bg='firebrick', fg='white', font=("Arial", 12, "bold"))
+        self.reset_button.pack()
+
+        self.stats_label = tk.Label(root, text="", bg='lightgrey', wraplength=580)
+        self.stats_label.pack()
+
+        # The axes span x from 50 to 550 and y from 350 up to 50
+        self.point_panel = PointPanel(root, self.load_points, (50, 50, 550, 350))
+        self.point_panel.pack(pady=5)
+
+        self.clear_live_points()
+        self.points_image = None
+        self.player = None
+
+        # Draw x and y axes
+        self.draw_axes()
+
+        root.protocol("WM_DELETE_WINDOW", self.close_window)
+
+    def on_canvas_click(self, event):
+        x, y = event.x, event.y
+        self.add_live_point((x, y))
+        self.draw_point(x, y)
+        self.draw_live_hull()
+
+    def draw_point(self, x, y):
+        self.canvas.create_oval(x - 2, y - 2, x + 2, y + 2, fill='white', outline='white')
+
+    def draw_point_image(self, pts):
+        # Imported points are drawn as one image item rather than an oval each
+        import numpy as np
+        mask = np.zeros((HEIGHT, WIDTH), dtype=bool)
+        xy = np.rint(pts).astype(np.intp)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                mask[np.clip(xy[:, 1] + dy, 0, HEIGHT - 1), np.clip(xy[:, 0] + dx, 0, WIDTH - 1)] = True
+        colors = np.where(mask, 'white', BACKGROUND)
+        # Tk discards the image once nothing in Python refers to it
+        self.points_image = tk.PhotoImage(master=self.root, width=WIDTH, height=HEIGHT)
+        self.points_image.put(" ".join("{%s}" % " ".join(row) for row in colors.tolist()))
+        self.canvas.create_image(0, 0, image=self.points_image, anchor=tk.NW, tags='points')
+        self.canvas.tag_lower('points')
+
+    def load_points(self, points):
+        # Points from the import panel replace the clicked ones. The panel fits
+        # them to the plot area with y growing upwards, the canvas's grows down.
+        self.reset_graph()
+        flipped = points.copy()
+        flipped[:, 1] = HEIGHT - points[:, 1]
+        self.set_live_points(flipped)
+        self.draw_point_image(self.points)
+        self.draw_live_hull()
+
+    def draw_live_hull(self):
+        self.canvas.delete('live')
+        hull = self.live_hull.vertices()
+        if len(hull) >= 2:
+            coords = [c for p in hull + hull[:1] for c in p]
+            self.canvas.create_line(*coords, tags='live', fill='gray', dash=(2, 2))
+
+    def draw_axes(self):
+        # Draw x-axis
+        self.canvas.create_line(50, 350, 550, 350, tags='axis', fill='gray', width=2)
+        for i in range(11):
+            x = 50 + i * 50
+            self.canvas.create_line(x, 345, x, 355, tags='axis', fill='gray', width=2)
+            self.canvas.create_text(x, 370, text=str(i), anchor=tk.N, tags='axis', fill='white', font=("Arial", 10, "bold"))
+
+        # Draw y-axis
+        self.canvas.create_line(50, 350, 50, 20, tags='axis', fill='gray', width=2)
+        for i in range(11):
+            y = 350 - i * 30
+            self.canvas.create_line(45, y, 55, y, tags='axis', fill='gray', width=2)
+            self.canvas.create_text(40, y, text=str(i), anchor=tk.E, tags='axis', fill='white', font=("Arial", 10, "bold"))
+
+    def stop_animation(self):
+        if self.player is not None:
+            self.player.stop()
+            self.player = None
+
+    def reset_graph(self):
+        self.stop_animation()
+        self.canvas.delete('all')
+        self.draw_axes()
+        self.stats_label.config(text="")
+        self.clear_live_points()
+        self.points_image = None
+
+    def calculate_hull(self):
+        self.stop_animation()
+        if self.too_many_to_animate():
+            self.canvas.delete('line')
+            hull, text = self.hull_at_once()
+            if len(hull) >= 2:
+                coords = [c for p in hull.tolist() + hull[:1].tolist() for c in p]
+                self.canvas.create_line(*coords, tags='line', fill='red', width=2)
+            self.stats_label.config(text=text)
+            return
+        # Candidate edges flash black as they are tested, hull edges stay red
+        renderer = CanvasRenderer(self.canvas, tag='line', test_color='black', edge_color='red', hull_color='red')
+        self.player = StepPlayer(self.root, brute_force_steps(point_tuples(self.points)), renderer, fps=4, on_done=self.show_stats).start()
+
+    def show_stats(self, state):
+        stats = HullStats()
+        brute_force_convex_hull(point_tuples(self.points), stats=stats)
+        self.stats_label.config(text=str(stats))
+
+    def close_window(self):
+        self.stop_animation()
+        self.root.destroy()
+
+Registry.register("convex_hull", "Brute Force", BruteForceApp)
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = BruteForceApp(root)
+    root.mainloop()
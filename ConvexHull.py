@@ -0,0 +1,638 @@
+import math
+from functools import cmp_to_key
+
+from Predicates import CCW_ERRBOUND, EPSILON, UNDERFLOW_ERRBOUND, orient, orient_exact
+
+# Headless convex hull engine. Every algorithm takes a sequence of (x, y)
+# pairs and returns the hull as a list of (x, y) tuples in counter-clockwise
+# order, starting at the lexicographically smallest point. Duplicate points
+# and collinear points on hull edges are dropped. Fewer than three distinct
+# points are returned sorted, and an all-collinear input returns its two
+# endpoints.
+#
+# Passing prefilter=True first discards the points strictly inside the
+# Akl-Toussaint octagon of extreme points. The test is vectorized, so it
+# needs NumPy, which is only imported when the pre-filter is used.
+#
+# The *_steps generators run the same algorithms but yield lightweight
+# (kind, data) step events for visualizers instead of returning the hull;
+# StepPlayer.py documents the event kinds and plays them back. The last
+# event is always ("done", hull).
+#
+# Passing stats=HullStats() counts the run's primitive operations: orientation
+# tests, comparisons made while sorting, and stack pushes and pops. Without it
+# the algorithms call cross and sorted directly, so counting costs nothing
+# when it is disabled.
+
+
+# > 0 if o -> a -> b turns counter-clockwise, < 0 if clockwise, 0 if collinear.
+# The sign is exact even for nearly collinear points; see Predicates.py.
+cross = orient
+
+
+class HullStats:
+    def __init__(self):
+        self.algorithm = None
+        self.n = 0  # distinct input points
+        self.h = 0  # hull vertices
+        self.orientation_tests = 0
+        self.comparisons = 0
+        self.pushes = 0
+        self.pops = 0
+
+    def tests_per_point(self):
+        # About log n for the O(n log n) algorithms, but h for Jarvis march
+        # and n^2 for brute force, which is what gives pathological inputs away
+        return self.orientation_tests / self.n if self.n else 0.0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def __str__(self):
+        return "n = %d, h = %d, orientation tests = %d (%.1f per point), comparisons = %d, pushes = %d, pops = %d" % (
+            self.n, self.h, self.orientation_tests, self.tests_per_point(), self.comparisons, self.pushes, self.pops)
+
+
+def _orientation(stats):
+    if stats is None:
+        return cross
+
+    def counted(o, a, b):
+        stats.orientation_tests += 1
+        return cross(o, a, b)
+    return counted
+
+
+class _CountingKey:
+    # Sort key that counts the comparisons made on it; sorted only uses <
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+
+def _sorted(items, stats, key=None):
+    if stats is None:
+        return sorted(items, key=key)
+    if key is None:
+        return sorted(items, key=lambda item: _CountingKey(item, stats))
+    return sorted(items, key=lambda item: _CountingKey(key(item), stats))
+
+
+def _finish(stats, algorithm, pts, hull):
+    if stats is not None:
+        stats.algorithm = algorithm
+        stats.n = len(pts)
+        stats.h = len(hull)
+    return hull
+
+
+def akl_toussaint(points):
+    points = list(points)
+    if len(points) < 9:
+        return points
+
+    import ArrayHull
+
+    keep = ArrayHull.akl_toussaint_mask(points).tolist()
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _unique(points, stats=None):
+    return _sorted(set(map(tuple, points)), stats)
+
+
+def _start_at_lowest(hull):
+    start = min(range(len(hull)), key=lambda i: hull[i])
+    return hull[start:] + hull[:start]
+
+
+def _on_segment(p, q, r):
+    return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[1] <= max(p[1], q[1])
+
+
+def _farther(p, a, b):
+    # Whether a is farther from p than b, for a and b on the same ray from p.
+    # Squared distances would underflow to 0 for tiny coordinates.
+    return a != b and _on_segment(p, a, b)
+
+
+def brute_force_edges(points, prefilter=False, stats=None, visualize=False):
+    # Returns the hull edges, and with visualize also every rejected pair,
+    # which takes O(n^2) memory; otherwise the second value is None
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    hull, non_hull = _hull_edges(pts, _orientation(stats), visualize)
+    # There is one hull edge per hull vertex
+    _finish(stats, "brute_force", pts, hull)
+    return hull, non_hull
+
+
+def _is_hull_edge(pts, p, q, orient):
+    # p -> q is a hull edge if no point lies to its right or on its line
+    # outside the segment
+    for r in pts:
+        c = orient(p, q, r)
+        if c < 0 or (c == 0 and not _on_segment(p, q, r)):
+            return False
+    return True
+
+
+def _hull_edges(pts, orient, visualize=False):
+    if visualize:
+        # Test every ordered pair, keeping the rejected ones for drawing
+        hull = []
+        non_hull = []
+        for p in pts:
+            for q in pts:
+                if p != q:
+                    (hull if _is_hull_edge(pts, p, q, orient) else non_hull).append((p, q))
+        return hull, non_hull
+
+    # Only pairs starting at a hull vertex can be edges, and each vertex has
+    # exactly one. Starting from the smallest point, which is on the hull,
+    # the end of each edge found is the next vertex to test from, so pairs
+    # starting at interior points are never tried.
+    hull = []
+    if len(pts) < 2:
+        return hull, None
+    p = pts[0]
+    while True:
+        q = next(q for q in pts if q != p and _is_hull_edge(pts, p, q, orient))
+        hull.append((p, q))
+        if q == pts[0]:
+            return hull, None
+        p = q
+
+
+def _chain_edges(pts, edges):
+    # Walk the hull edges counter-clockwise from the smallest point
+    next_vertex = dict(edges)
+
+    hull = [pts[0]]
+    p = next_vertex[pts[0]]
+    while p != pts[0]:
+        hull.append(p)
+        p = next_vertex[p]
+    return hull
+
+
+def brute_force_convex_hull(points, prefilter=False, stats=None):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "brute_force", pts, pts)
+
+    edges, _ = _hull_edges(pts, _orientation(stats))
+    return _finish(stats, "brute_force", pts, _chain_edges(pts, edges))
+
+
+def brute_force_steps(points, prefilter=False):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points)
+    if len(pts) < 3:
+        yield ("done", pts)
+        return
+
+    edges = []
+    for p in pts:
+        for q in pts:
+            if p == q:
+                continue
+            yield ("test", (p, q))
+            if all(cross(p, q, r) > 0 or (cross(p, q, r) == 0 and _on_segment(p, q, r)) for r in pts):
+                edges.append((p, q))
+                yield ("accept", (p, q))
+
+    yield ("done", _chain_edges(pts, edges))
+
+
+# Relative gap below which two polar sort keys may be in the wrong order
+KEY_TOLERANCE = 16 * EPSILON
+
+
+def _polar_sorted(pts, pivot, exact=True, stats=None):
+    # pts in counter-clockwise order around pivot, their lowest (then
+    # leftmost) point, nearest first when directions tie. exact=False sorts
+    # by atan2 instead, whose rounding can order nearly collinear points
+    # inconsistently with the scan's own cross products.
+    px, py = pivot
+    if not exact:
+        def polar_key(p):
+            dx, dy = p[0] - px, p[1] - py
+            return math.atan2(dy, dx), dx * dx + dy * dy
+        return _sorted(pts, stats, key=polar_key)
+
+    # No point lies below the pivot, so the angle grows with -dx / dy. The
+    # float keys are within a few ulps of the exact ones, so only runs of
+    # equal or nearly equal keys can be out of order; those are re-sorted
+    # with the cross-product comparator.
+    keys = [(px - x) / (y - py) if y != py else -math.inf for x, y in pts]
+    order = _sorted(range(len(pts)), stats, key=keys.__getitem__)
+    sorted_points = [pts[i] for i in order]
+    keys = [keys[i] for i in order]
+
+    orient = _orientation(stats)
+
+    def compare(a, b):
+        c = orient(pivot, a, b)
+        if c:
+            return -1 if c > 0 else 1
+        return _farther(pivot, a, b) - _farther(pivot, b, a)
+
+    i = 0
+    while i < len(keys):
+        j = i + 1
+        while j < len(keys) and (keys[j] == keys[j - 1] or keys[j] - keys[j - 1] <= KEY_TOLERANCE * abs(keys[j])):
+            j += 1
+        if j - i > 1:
+            sorted_points[i:j] = _sorted(sorted_points[i:j], stats, key=cmp_to_key(compare))
+        i = j
+    return sorted_points
+
+
+def graham_scan(points, prefilter=False, stats=None, exact=True):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "graham_scan", pts, pts)
+    return _finish(stats, "graham_scan", pts, _graham_hull(pts, stats, exact))
+
+
+def _graham_hull(pts, stats=None, exact=True):
+    orient = _orientation(stats)
+
+    # Find the point with the lowest y-coordinate (and leftmost if ties)
+    pivot = min(pts, key=lambda p: (p[1], p[0]))
+
+    # Sort the points based on polar angle from the pivot, nearest first on ties
+    sorted_points = _polar_sorted(pts, pivot, exact, stats)
+
+    hull = []
+    for p in sorted_points:
+        while len(hull) >= 2 and orient(hull[-2], hull[-1], p) <= 0:
+            hull.pop()
+        hull.append(p)
+
+    # Every point is pushed once, so the pops are whatever did not stay
+    if stats is not None:
+        stats.pushes += len(sorted_points)
+        stats.pops += len(sorted_points) - len(hull)
+    return _start_at_lowest(hull)
+
+
+def graham_scan_steps(points, prefilter=False, exact=True):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points)
+    if len(pts) < 3:
+        yield ("done", pts)
+        return
+
+    pivot = min(pts, key=lambda p: (p[1], p[0]))
+
+    hull = []
+    for p in _polar_sorted(pts, pivot, exact):
+        while len(hull) >= 2:
+            yield ("test", (hull[-2], hull[-1], p))
+            if cross(hull[-2], hull[-1], p) > 0:
+                break
+            yield ("pop", hull.pop())
+        hull.append(p)
+        yield ("push", p)
+
+    yield ("done", _start_at_lowest(hull))
+
+
+def jarvis_march(points, prefilter=False, stats=None):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "jarvis_march", pts, pts)
+
+    orient = _orientation(stats)
+    hull = []
+    start = pts[0]
+    p = start
+    while True:
+        hull.append(p)
+        # Pick the point that leaves every other point on the left of p -> q,
+        # preferring the farthest one when several are collinear
+        q = pts[0] if p != pts[0] else pts[1]
+        for r in pts:
+            c = orient(p, q, r)
+            if c < 0 or (c == 0 and _farther(p, r, q)):
+                q = r
+        p = q
+        if p == start:
+            break
+
+    return _finish(stats, "jarvis_march", pts, hull)
+
+
+def jarvis_march_steps(points, prefilter=False):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points)
+    if len(pts) < 3:
+        yield ("done", pts)
+        return
+
+    hull = []
+    start = pts[0]
+    p = start
+    while True:
+        hull.append(p)
+        yield ("push", p)
+        q = pts[0] if p != pts[0] else pts[1]
+        for r in pts:
+            yield ("test", (p, q, r))
+            c = cross(p, q, r)
+            if c < 0 or (c == 0 and _farther(p, r, q)):
+                q = r
+        p = q
+        if p == start:
+            break
+
+    yield ("done", hull)
+
+
+def _quick_hull_stack(pts, orient=cross):
+    a, b = pts[0], pts[-1]
+    lower = []
+    upper = []
+    for r in pts:
+        c = orient(a, b, r)
+        if c < 0:
+            lower.append(r)
+        elif c > 0:
+            upper.append(r)
+
+    # Each stack entry is an edge p -> q with the points to its right. Popping
+    # an edge either makes p the next hull vertex or splits the edge at its
+    # farthest point, handing each half only the points outside it.
+    return [(b, a, upper), (a, b, lower)]
+
+
+def _quick_hull_split(p, q, outside, orient=cross):
+    dists = [orient(q, p, r) for r in outside]
+    max_dist = max(dists, default=0)
+    if max_dist <= 0:
+        return None
+
+    # A point that is not truly the farthest may not be a hull vertex, so the
+    # distances within rounding error of the maximum are compared exactly
+    reach = max(abs(r[0] - q[0]) + abs(r[1] - q[1]) for r in outside)
+    slack = 4 * CCW_ERRBOUND * (abs(p[0] - q[0]) + abs(p[1] - q[1])) * reach + 2 * UNDERFLOW_ERRBOUND
+    farthest = [r for r, dist in zip(outside, dists) if dist >= max_dist - slack]
+    f = farthest[0] if len(farthest) == 1 else max(farthest, key=lambda r: orient_exact(q, p, r))
+    return f, [r for r in outside if orient(p, f, r) < 0], [r for r in outside if orient(f, q, r) < 0]
+
+
+def quick_hull(points, prefilter=False, stats=None):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "quick_hull", pts, pts)
+
+    orient = _orientation(stats)
+    hull = []
+    stack = _quick_hull_stack(pts, orient)
+    while stack:
+        p, q, outside = stack.pop()
+        split = _quick_hull_split(p, q, outside, orient)
+        if split is None:
+            hull.append(p)
+            continue
+
+        f, before, after = split
+        stack.append((f, q, after))
+        stack.append((p, f, before))
+
+    # Each of the h - 2 splits pushes two edges onto the initial two, and
+    # every edge is popped
+    if stats is not None:
+        stats.pushes += 2 * len(hull) - 2
+        stats.pops += 2 * len(hull) - 2
+    return _finish(stats, "quick_hull", pts, hull)
+
+
+def quick_hull_steps(points, prefilter=False):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points)
+    if len(pts) < 3:
+        yield ("done", pts)
+        return
+
+    # The working chain is the partial hull: the finished vertices followed by
+    # the start of every edge still waiting on the stack
+    hull = []
+    stack = _quick_hull_stack(pts)
+    yield ("hull", [edge[0] for edge in reversed(stack)])
+    while stack:
+        p, q, outside = stack.pop()
+        yield ("test", (p, q))
+        split = _quick_hull_split(p, q, outside)
+        if split is None:
+            hull.append(p)
+            continue
+
+        f, before, after = split
+        stack.append((f, q, after))
+        stack.append((p, f, before))
+        yield ("hull", hull + [edge[0] for edge in reversed(stack)])
+
+    yield ("done", hull)
+
+
+def monotone_chains(points, stats=None):
+    # Lower chain runs left to right, upper chain right to left; both include
+    # the leftmost and rightmost points
+    return _monotone_chains(_unique(points, stats), stats)
+
+
+def _monotone_chains(pts, stats=None):
+    orient = _orientation(stats)
+
+    def build_hull(points):
+        hull = []
+        for p in points:
+            while len(hull) >= 2 and orient(hull[-2], hull[-1], p) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull
+
+    lower, upper = build_hull(pts), build_hull(reversed(pts))
+    if stats is not None:
+        stats.pushes += 2 * len(pts)
+        stats.pops += 2 * len(pts) - len(lower) - len(upper)
+    return lower, upper
+
+
+def monotone_chain(points, prefilter=False, stats=None):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "monotone_chain", pts, pts)
+
+    lower_hull, upper_hull = _monotone_chains(pts, stats)
+    return _finish(stats, "monotone_chain", pts, lower_hull[:-1] + upper_hull[:-1])
+
+
+def monotone_chain_steps(points, prefilter=False):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points)
+    if len(pts) < 3:
+        yield ("done", pts)
+        return
+
+    # Build the lower chain and then the upper chain on top of it in a
+    # single stack, never popping below the last lower-chain point
+    hull = []
+
+    def build_hull(points, floor):
+        for p in points:
+            while len(hull) - floor >= 2:
+                yield ("test", (hull[-2], hull[-1], p))
+                if cross(hull[-2], hull[-1], p) > 0:
+                    break
+                yield ("pop", hull.pop())
+            hull.append(p)
+            yield ("push", p)
+
+    yield from build_hull(pts, 0)
+    yield from build_hull(pts[-2::-1], len(hull) - 1)
+
+    yield ("done", hull[:-1])
+
+
+def _tangent(hull, p, orient=cross):
+    # Index of the vertex q of a convex counter-clockwise hull that leaves every
+    # vertex on the left of p -> q, for a hull vertex p outside this hull. Seen
+    # from p the vertices' directions rise and fall once around the hull, so
+    # the most clockwise one is found by binary search.
+    k = len(hull)
+    if k == 1:
+        return 0
+
+    def ccw_of(i, j):
+        # hull[j] is strictly counter-clockwise of hull[i] around p
+        return orient(p, hull[i % k], hull[j % k]) > 0
+
+    if ccw_of(0, 1):
+        def past_tangent(i):
+            return ccw_of(i, i + 1) and ccw_of(i, 0)
+    else:
+        def past_tangent(i):
+            return ccw_of(i, i + 1) or ccw_of(0, i)
+
+    lo, hi = 1, k
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if past_tangent(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    # Settle collinear ties on the farthest vertex
+    i = lo % k
+    while True:
+        for j in ((i - 1) % k, (i + 1) % k):
+            if ccw_of(j, i) or (not ccw_of(i, j) and _farther(p, hull[j], hull[i])):
+                i = j
+                break
+        else:
+            return i
+
+
+def _chan_wrap(pts, m, stats=None):
+    # Jarvis march over Graham-scan hulls of groups of m points, giving up
+    # once the hull has more than m vertices
+    orient = _orientation(stats)
+    groups = [pts[i:i + m] for i in range(0, len(pts), m)]
+    mini_hulls = [_graham_hull(group, stats) if len(group) >= 3 else group for group in groups]
+    positions = [{v: i for i, v in enumerate(mini_hull)} for mini_hull in mini_hulls]
+
+    start = pts[0]
+    hull = [start]
+    p = start
+    for _ in range(m):
+        q = None
+        for mini_hull, position in zip(mini_hulls, positions):
+            if p in position:
+                r = mini_hull[(position[p] + 1) % len(mini_hull)]
+            else:
+                r = mini_hull[_tangent(mini_hull, p, orient)]
+            if r == p:
+                continue
+            if q is None:
+                q = r
+            else:
+                c = orient(p, q, r)
+                if c < 0 or (c == 0 and _farther(p, r, q)):
+                    q = r
+        if q == start:
+            return hull
+        hull.append(q)
+        p = q
+    return None
+
+
+def chan(points, prefilter=False, stats=None):
+    if prefilter:
+        points = akl_toussaint(points)
+    pts = _unique(points, stats)
+    if len(pts) < 3:
+        return _finish(stats, "chan", pts, pts)
+
+    # Guess the hull size as m = 2^(2^t), squaring the guess after each failure.
+    # Start at m = 256: smaller groups cost more in per-call overhead than
+    # they save.
+    t = 3
+    while True:
+        m = min(2 ** (2 ** t), len(pts))
+        hull = _chan_wrap(pts, m, stats)
+        if hull is not None:
+            return _finish(stats, "chan", pts, hull)
+        t += 1
+
+
+ALGORITHMS = {
+    "brute_force": brute_force_convex_hull,
+    "graham_scan": graham_scan,
+    "jarvis_march": jarvis_march,
+    "quick_hull": quick_hull,
+    "monotone_chain": monotone_chain,
+    "chan": chan,
+}
+
+
+STEPS = {
+    "brute_force": brute_force_steps,
+    "graham_scan": graham_scan_steps,
+    "jarvis_march": jarvis_march_steps,
+    "quick_hull": quick_hull_steps,
+    "monotone_chain": monotone_chain_steps,
+}
+
+
+def convex_hull(points, algorithm="monotone_chain", prefilter=False, stats=None):
+    try:
+        hull_function = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError("Unknown convex hull algorithm: %r" % (algorithm,))
+    return hull_function(points, prefilter=prefilter, stats=stats)
@@ -0,0 +1,115 @@
+import os
+
+import numpy as np
+
+# Generated inputs for the benchmarks and the visualizers. Every generator
+# takes a NumPy Generator and a size and returns an (N, 2) float array of
+# points; segments() turns a point distribution into an (N, 4) array of x1,
+# y1, x2, y2 rows. load() reads points or segments from a file.
+
+
+def uniform_square(rng, n):
+    return rng.random((n, 2))
+
+
+def uniform_disk(rng, n):
+    radius = np.sqrt(rng.random(n))
+    angle = rng.random(n) * 2 * np.pi
+    return np.column_stack((radius * np.cos(angle), radius * np.sin(angle)))
+
+
+def circle(rng, n):
+    # Every point is a hull vertex
+    angle = rng.random(n) * 2 * np.pi
+    return np.column_stack((np.cos(angle), np.sin(angle)))
+
+
+def gaussian(rng, n):
+    return rng.standard_normal((n, 2))
+
+
+def clustered(rng, n, clusters=8):
+    # Gaussian blobs around a few centres in the unit square
+    centres = rng.random((clusters, 2))
+    return centres[rng.integers(clusters, size=n)] + 0.03 * rng.standard_normal((n, 2))
+
+
+def collinear_heavy(rng, n):
+    # Points on a few lines through the unit square, including the square's
+    # edges, so hull edges carry many collinear points
+    lines = np.array([
+        [0, 0, 1, 0], [1, 0, 1, 1], [1, 1, 0, 1], [0, 1, 0, 0],
+        [0, 0, 1, 1], [0, 1, 1, 0], [0, 0.5, 1, 0.5],
+    ])
+    chosen = lines[rng.integers(len(lines), size=n)]
+    t = rng.random((n, 1))
+    return chosen[:, :2] + t * (chosen[:, 2:] - chosen[:, :2])
+
+
+def duplicate_heavy(rng, n):
+    # About sqrt(n) distinct points, each repeated many times
+    pool = rng.random((max(1, int(np.sqrt(n))), 2))
+    return pool[rng.integers(len(pool), size=n)]
+
+
+POINTS = {
+    "uniform": uniform_square,
+    "disk": uniform_disk,
+    "circle": circle,
+    "gaussian": gaussian,
+    "clustered": clustered,
+    "collinear": collinear_heavy,
+    "duplicates": duplicate_heavy,
+}
+
+
+def points(name, n, seed=0):
+    if name not in POINTS:
+        raise ValueError("Unknown dataset: %r" % (name,))
+    return POINTS[name](np.random.default_rng(seed), n)
+
+
+def load(path, columns):
+    # CSV (.csv, .txt, an optional header line is skipped), NumPy (.npy) or
+    # raw native float64 values (any other extension), as an (N, columns)
+    # float64 array
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        data = np.load(path, mmap_mode="r")
+    elif ext in (".csv", ".txt"):
+        with open(path) as f:
+            first = f.readline()
+        try:
+            [float(v) for v in first.split(",")]
+            skip = 0
+        except ValueError:
+            skip = 1
+        data = np.loadtxt(path, delimiter=",", skiprows=skip, ndmin=2)
+    else:
+        data = np.fromfile(path, dtype=np.float64)
+        if len(data) % columns:
+            raise ValueError("%s: %d values do not form rows of %d" % (path, len(data), columns))
+        data = data.reshape(-1, columns)
+    if data.ndim != 2 or data.shape[1] != columns:
+        raise ValueError("%s: expected rows of %d values, got shape %r" % (path, columns, data.shape))
+    return np.ascontiguousarray(data, dtype=np.float64)
+
+
+def random_segments(rng, n, length):
+    # Segments starting uniformly in the unit square, each coordinate of the
+    # end point within length of the start
+    start = rng.random((n, 2))
+    end = start + (rng.random((n, 2)) - 0.5) * 2 * length
+    return np.hstack((start, end))
+
+
+def segments(name, n, seed=0, length=None):
+    # Segments from each point of the named distribution towards a second
+    # point of it, shortened to length times the distance between them. The
+    # default length of 1 / sqrt(n) keeps the number of intersections roughly
+    # linear in n.
+    if length is None:
+        length = min(1.0, 1 / np.sqrt(max(n, 1)))
+    start = points(name, n, seed)
+    other = points(name, n, seed + 1)
+    return np.hstack((start, start + (other - start) * length))
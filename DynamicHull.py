@@ -0,0 +1,322 @@
+import random
+from bisect import bisect_left
+from collections import deque
+
+from ConvexHull import cross
+
+# Convex hull that grows one point at a time. As in ConvexHull.monotone_chain
+# the hull is kept as a lower and an upper chain between the lexicographically
+# smallest and largest points, each a list sorted by (x, y). A new point is
+# located in each chain by binary search; if it lies outside the chain it is
+# inserted there and the neighbours it makes non-convex are removed on both
+# sides. Each point is removed at most once, so an insertion makes O(log n)
+# amortized comparisons, but the list insert and deletes move O(h)
+# references, with h the number of hull vertices: O(log n + h) amortized time
+# per insertion. That is O(log n) for random points, whose hulls stay small,
+# and O(n) for points on a circle, where every point is a vertex.
+
+
+class _Chain:
+    # The lower chain turns counter-clockwise from left to right (turn = 1),
+    # the upper chain clockwise (turn = -1)
+    def __init__(self, turn):
+        self.turn = turn
+        self.points = []
+
+    def side(self, i, p):
+        # > 0 if p is strictly inside the chain's edge ending at points[i]
+        return self.turn * cross(self.points[i - 1], self.points[i], p)
+
+    def contains(self, p):
+        pts = self.points
+        i = bisect_left(pts, p)
+        if i < len(pts) and pts[i] == p:
+            return True
+        if i == 0 or i == len(pts):
+            return False
+        return self.side(i, p) >= 0
+
+    def insert(self, p):
+        # Returns True if p became a vertex of the chain
+        pts = self.points
+        i = bisect_left(pts, p)
+        if i < len(pts) and pts[i] == p:
+            return False
+        if 0 < i < len(pts) and self.side(i, p) >= 0:
+            return False
+
+        pts.insert(i, p)
+        while i >= 2 and self.turn * cross(pts[i - 2], pts[i - 1], p) <= 0:
+            del pts[i - 1]
+            i -= 1
+        while i + 2 < len(pts) and self.turn * cross(p, pts[i + 1], pts[i + 2]) <= 0:
+            del pts[i + 1]
+        return True
+
+
+class DynamicHull:
+    def __init__(self, points=()):
+        self.lower = _Chain(1)
+        self.upper = _Chain(-1)
+        self.extend(points)
+
+    def insert(self, point):
+        # Add a point; returns True if the hull changed
+        p = tuple(point)
+        lower = self.lower.insert(p)
+        upper = self.upper.insert(p)
+        return lower or upper
+
+    def extend(self, points):
+        changed = False
+        for p in points:
+            changed = self.insert(p) or changed
+        return changed
+
+    def __contains__(self, point):
+        # True if the point lies inside the hull or on its boundary
+        p = tuple(point)
+        return self.lower.contains(p) and self.upper.contains(p)
+
+    def __len__(self):
+        return len(self.vertices())
+
+    def clear(self):
+        self.lower.points = []
+        self.upper.points = []
+
+    def vertices(self):
+        # Same order as ConvexHull.monotone_chain: counter-clockwise from the
+        # lexicographically smallest point
+        lower, upper = self.lower.points, self.upper.points
+        if len(lower) < 2:
+            return list(lower)
+        return lower[:-1] + upper[:0:-1]
+
+
+# Fully dynamic hull (Overmars and van Leeuwen). The points are kept in a
+# treap ordered by (x, y), and every treap node stores the upper chain of its
+# subtree as a second, persistent treap. A node's chain is its left child's
+# chain up to a bridge, then its right child's chain from there, so it can be
+# built from the children's chains by splitting and joining O(log n) chain
+# nodes without modifying them. An insertion or deletion rebuilds the chains
+# of the O(log n) nodes on its path, and finding each bridge takes O(log^2 h)
+# orientation tests, for O(log n log^2 h) per update. The lower chain is the
+# upper chain of the points rotated by 180 degrees.
+
+
+class _ChainNode:
+    # Immutable treap node of a chain, sorted by (x, y)
+    __slots__ = ("point", "priority", "left", "right", "first", "last")
+
+    def __init__(self, point, priority, left=None, right=None):
+        self.point = point
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.first = left.first if left is not None else point
+        self.last = right.last if right is not None else point
+
+
+def _join(a, b):
+    # Chain of a followed by b, where every point of a precedes those of b
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        return _ChainNode(a.point, a.priority, a.left, _join(a.right, b))
+    return _ChainNode(b.point, b.priority, _join(a, b.left), b.right)
+
+
+def _upto(t, key):
+    # The points of chain t up to and including key
+    if t is None or t.last <= key:
+        return t
+    if t.point <= key:
+        return _ChainNode(t.point, t.priority, t.left, _upto(t.right, key))
+    return _upto(t.left, key)
+
+
+def _from(t, key):
+    # The points of chain t from key on
+    if t is None or t.first >= key:
+        return t
+    if t.point >= key:
+        return _ChainNode(t.point, t.priority, _from(t.left, key), t.right)
+    return _from(t.right, key)
+
+
+def _tangent(p, t):
+    # The point q of chain t where the upper tangent from p, which precedes
+    # every point of t, touches it: the first q with p -> q -> next(q) a
+    # clockwise turn, or the last point. Seen from p the chain turns
+    # counter-clockwise up to q and clockwise after it, so binary search
+    # finds it. next is the leftmost point of the right subtree, or else the
+    # node where the search last went left.
+    best = None
+    after = None
+    while t is not None:
+        succ = t.right.first if t.right is not None else after
+        if succ is None or cross(p, t.point, succ) < 0:
+            best = after = t.point
+            t = t.left
+        else:
+            t = t.right
+    return best
+
+
+def _bridge(a, b):
+    # The upper tangent of chains a and b, where a precedes b: the first
+    # point p of a whose successor is not strictly above the line from p to
+    # its tangent point on b
+    best = None
+    after = None
+    while a is not None:
+        p = a.point
+        q = _tangent(p, b)
+        succ = a.right.first if a.right is not None else after
+        if succ is None or cross(p, q, succ) <= 0:
+            best = (p, q)
+            after = p
+            a = a.left
+        else:
+            a = a.right
+    return best
+
+
+def _merge_chains(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    p, q = _bridge(a, b)
+    return _join(_upto(a, p), _from(b, q))
+
+
+def _chain_points(t, out):
+    while t is not None:
+        _chain_points(t.left, out)
+        out.append(t.point)
+        t = t.right
+    return out
+
+
+class _Node:
+    __slots__ = ("point", "priority", "count", "left", "right", "upper", "lower")
+
+    def __init__(self, point):
+        self.point = point
+        self.priority = random.random()
+        self.count = 1
+        self.left = None
+        self.right = None
+        self.update()
+
+    def update(self):
+        # Rebuild this node's chains from its children's
+        p = self.point
+        left, right = self.left, self.right
+        upper = _ChainNode(p, random.random())
+        lower = _ChainNode((-p[0], -p[1]), random.random())
+        if left is not None:
+            upper = _merge_chains(left.upper, upper)
+            lower = _merge_chains(lower, left.lower)
+        if right is not None:
+            upper = _merge_chains(upper, right.upper)
+            lower = _merge_chains(right.lower, lower)
+        self.upper = upper
+        self.lower = lower
+
+
+def _split(node, key, inclusive=False):
+    # Treaps of the points before key (or up to key, if inclusive) and of
+    # the others
+    if node is None:
+        return None, None
+    if node.point < key or inclusive and node.point == key:
+        node.right, rest = _split(node.right, key, inclusive)
+        node.update()
+        return node, rest
+    rest, node.left = _split(node.left, key, inclusive)
+    node.update()
+    return rest, node
+
+
+def _merge(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        a.right = _merge(a.right, b)
+        a.update()
+        return a
+    b.left = _merge(a, b.left)
+    b.update()
+    return b
+
+
+class FullyDynamicHull:
+    # Hull of a multiset of points supporting both insert and delete. As for
+    # DynamicHull, len() is the number of hull vertices; point_count is the
+    # number of points stored, duplicates included.
+    def __init__(self, points=()):
+        self.root = None
+        self.point_count = 0
+        for p in points:
+            self.insert(p)
+
+    def _find(self, p):
+        node = self.root
+        while node is not None and node.point != p:
+            node = node.left if p < node.point else node.right
+        return node
+
+    def insert(self, point):
+        p = tuple(point)
+        self.point_count += 1
+        node = self._find(p)
+        if node is not None:
+            node.count += 1
+            return
+        before, after = _split(self.root, p)
+        self.root = _merge(_merge(before, _Node(p)), after)
+
+    def delete(self, point):
+        p = tuple(point)
+        node = self._find(p)
+        if node is None:
+            raise KeyError(p)
+        self.point_count -= 1
+        if node.count > 1:
+            node.count -= 1
+            return
+        before, rest = _split(self.root, p)
+        _, after = _split(rest, p, inclusive=True)
+        self.root = _merge(before, after)
+
+    def __len__(self):
+        return len(self.vertices())
+
+    def vertices(self):
+        # Same order as ConvexHull.monotone_chain
+        if self.root is None:
+            return []
+        upper = _chain_points(self.root.upper, [])
+        lower = [(-x, -y) for x, y in reversed(_chain_points(self.root.lower, []))]
+        if len(upper) < 2:
+            return upper
+        return lower[:-1] + upper[:0:-1]
+
+
+def sliding_window(points, size):
+    # Yields the hull of the last `size` points after each point arrives
+    hull = FullyDynamicHull()
+    window = deque()
+    for p in points:
+        hull.insert(p)
+        window.append(p)
+        if len(window) > size:
+            hull.delete(window.popleft())
+        yield hull.vertices()
@@ -0,0 +1,134 @@
+# Point and segment types shared by the intersection modules. Point has
+# __slots__, so it carries no per-instance __dict__. PointArray and
+# SegmentArray keep many points or segments in one contiguous float64 array
+# and build Point objects only when indexed. np.asarray on either returns
+# that array without copying, so the NumPy routines (ArrayHull,
+# Lineintersection_batch) take them directly, while the per-object routines
+# iterate them as points or (Point, Point) pairs. NumPy is imported when the
+# first array is built, so Point alone does not load it.
+
+
+class Point:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return "Point(%r, %r)" % (self.x, self.y)
+
+
+# Rows converted to Python floats at a time when iterating
+BLOCK = 4096
+
+
+def _rows(data):
+    for start in range(0, len(data), BLOCK):
+        yield from data[start:start + BLOCK].tolist()
+
+
+def _float_array(data, columns, name):
+    import numpy as np
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    if data.ndim != 2 or data.shape[1] != columns:
+        raise ValueError("%s must be an (N, %d) array, got shape %r" % (name, columns, data.shape))
+    return data
+
+
+class PointArray:
+    def __init__(self, data):
+        # data is anything np.asarray turns into an (N, 2) array; a
+        # contiguous float64 array is used as is
+        self.data = _float_array(data, 2, "points")
+
+    @classmethod
+    def from_points(cls, points):
+        # From Point objects or (x, y) pairs
+        import numpy as np
+        return cls(np.array([tuple(p) for p in points], dtype=np.float64).reshape(-1, 2))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return PointArray(self.data[i])
+        x, y = self.data[i].tolist()
+        return Point(x, y)
+
+    def __iter__(self):
+        for x, y in _rows(self.data):
+            yield Point(x, y)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or self.data.dtype == dtype:
+            return self.data.copy() if copy else self.data
+        return self.data.astype(dtype)
+
+    @property
+    def x(self):
+        return self.data[:, 0]
+
+    @property
+    def y(self):
+        return self.data[:, 1]
+
+
+class SegmentArray:
+    # Rows of x1, y1, x2, y2
+    def __init__(self, data):
+        self.data = _float_array(data, 4, "segments")
+
+    @classmethod
+    def from_segments(cls, segments):
+        # From (Point, Point) pairs, pairs of (x, y) pairs, or x1, y1, x2, y2
+        # tuples
+        rows = []
+        for s in segments:
+            if len(s) == 4:
+                rows.append(tuple(s))
+            else:
+                p, q = s
+                rows.append((*p, *q))
+        import numpy as np
+        return cls(np.array(rows, dtype=np.float64).reshape(-1, 4))
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return SegmentArray(self.data[i])
+        x1, y1, x2, y2 = self.data[i].tolist()
+        return Point(x1, y1), Point(x2, y2)
+
+    def __iter__(self):
+        for x1, y1, x2, y2 in _rows(self.data):
+            yield Point(x1, y1), Point(x2, y2)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or self.data.dtype == dtype:
+            return self.data.copy() if copy else self.data
+        return self.data.astype(dtype)
+
+    # (N, 2) views of the start and end points
+    @property
+    def starts(self):
+        return self.data[:, :2]
+
+    @property
+    def ends(self):
+        return self.data[:, 2:]
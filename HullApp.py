@@ -0,0 +1,172 @@
+import tkinter as tk
+
+import ConvexHull
+from DynamicHull import DynamicHull
+from PointPanel import ANIMATE_LIMIT, PointPanel, append_point, array_hull, array_hull_text, no_points, point_tuples
+from StepPlayer import AxesLine, AxesRenderer, StepPlayer
+
+# Plumbing shared by the hull visualizers. LivePoints holds the points, as one
+# (N, 2) array, and the hull of the points so far, which every visualizer
+# draws as a dotted outline, and decides when there are too many points to
+# animate. AxesHullApp is the matplotlib window of the Graham scan, Jarvis
+# march and monotone chain visualizers, which differ only in the algorithm.
+
+
+class LivePoints:
+    # Above animate_limit points the hull is computed at once with the
+    # ArrayHull function array_hull_name
+    animate_limit = ANIMATE_LIMIT
+    array_hull_name = "monotone_chain_indices"
+
+    def clear_live_points(self):
+        self.points = no_points()
+        self.live_hull = DynamicHull()
+
+    def add_live_point(self, point):
+        self.points = append_point(self.points, point)
+        self.live_hull.insert(point)
+
+    def set_live_points(self, points):
+        # Points from the import panel replace the clicked ones. Only the
+        # array's hull vertices need to go through the live hull.
+        self.points = points
+        self.live_hull = DynamicHull(point_tuples(array_hull("monotone_chain_indices", points)[0]))
+
+    def too_many_to_animate(self):
+        return len(self.points) > self.animate_limit
+
+    def hull_at_once(self):
+        # The hull vertices as an (H, 2) array, and the text shown in place
+        # of the operation counts
+        hull, seconds = array_hull(self.array_hull_name, self.points)
+        return hull, array_hull_text(self.array_hull_name, self.points, hull, seconds)
+
+
+class AxesHullApp(LivePoints):
+    # Subclasses set title and array_hull_name and provide hull_steps(points)
+    # and count_operations(points, stats)
+    title = "Convex Hull"
+    geometry = None
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title(self.title)
+        if self.geometry:
+            self.root.geometry(self.geometry)
+
+        self.clear_live_points()
+        self.convex_hull = []
+        self.player = None
+
+        # Imported here so that importing the visualizers does not load
+        # matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        # A plain Figure, not pyplot's, so closing the window frees it
+        self.fig = Figure()
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.root)
+        self.canvas_widget = self.canvas.get_tk_widget()
+        self.canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=1)
+        self.ax.set_xlim([0, 10])
+        self.ax.set_ylim([0, 10])
+        # One artist each for the points and the live hull, updated in place
+        self.point_markers = AxesLine(self.ax, 'bo', label='Points')
+        self.live_line = AxesLine(self.ax, 'k:', closed=True)
+
+        self.canvas.draw_idle()
+
+        self.info_label = tk.Label(root, text="Click on the canvas to add points.", bg="#f0f0f0", pady=10)
+        self.info_label.pack()
+
+        self.stats_label = tk.Label(root, text="", bg="#f0f0f0", wraplength=550)
+        self.stats_label.pack()
+
+        self.plot_button = tk.Button(root, text="Plot Convex Hull", command=self.plot_convex_hull, bg="#4caf50", fg="white")
+        self.plot_button.pack(pady=5)
+
+        self.reset_button = tk.Button(root, text="Reset", command=self.reset, bg="#ff5722", fg="white")
+        self.reset_button.pack(pady=5)
+
+        self.point_panel = PointPanel(root, self.set_points, (0, 0, 10, 10))
+        self.point_panel.pack(pady=5)
+
+        self.canvas.mpl_connect('button_press_event', self.on_canvas_click)
+
+        root.protocol("WM_DELETE_WINDOW", self.close_window)
+
+    def on_canvas_click(self, event):
+        x, y = event.xdata, event.ydata
+        if x is not None and y is not None:
+            self.add_live_point((x, y))
+            self.point_markers.set_points(self.points)
+            self.live_line.set_points(self.live_hull.vertices())
+            self.update_plot_limits()
+            self.canvas.draw_idle()
+
+    def set_points(self, points):
+        self.reset()
+        self.set_live_points(points)
+        self.point_markers.set_points(points)
+        self.live_line.set_points(self.live_hull.vertices())
+        self.update_plot_limits()
+        self.info_label.config(text="%d points loaded. Click on the canvas to add more." % len(points), fg="black")
+        self.canvas.draw_idle()
+
+    def update_plot_limits(self):
+        self.ax.set_xlim([0, 10])
+        self.ax.set_ylim([0, 10])
+
+    def plot_convex_hull(self):
+        if len(self.points) < 3:
+            self.info_label.config(text="At least 3 points are required.", fg="red")
+            return
+
+        self.info_label.config(text="Calculating Convex Hull...", fg="black")
+
+        self.ax.clear()
+        self.point_markers.set_points(self.points)
+        self.ax.legend()
+        self.update_plot_limits()
+        self.canvas.draw_idle()
+
+        self.stop_animation()
+        if self.too_many_to_animate():
+            # Too many points to animate, so draw the hull of the array at once
+            hull, text = self.hull_at_once()
+            self.convex_hull = point_tuples(hull)
+            AxesLine(self.ax, 'r-', closed=True).set_points(hull)
+            self.canvas.draw_idle()
+            self.info_label.config(text="Convex Hull Plotted.", fg="green")
+            self.stats_label.config(text=text)
+            return
+        steps = self.hull_steps(point_tuples(self.points))
+        self.player = StepPlayer(self.root, steps, AxesRenderer(self.ax, self.canvas), fps=10, on_done=self.hull_plotted).start()
+
+    def hull_plotted(self, state):
+        self.convex_hull = state.hull
+        self.info_label.config(text="Convex Hull Plotted.", fg="green")
+
+        # Count the operations on a separate headless run
+        stats = ConvexHull.HullStats()
+        self.count_operations(point_tuples(self.points), stats)
+        self.stats_label.config(text=str(stats))
+
+    def stop_animation(self):
+        if self.player is not None:
+            self.player.stop()
+            self.player = None
+
+    def reset(self):
+        self.stop_animation()
+        self.clear_live_points()
+        self.convex_hull = []
+        self.ax.clear()
+        self.info_label.config(text="Click on the canvas to add points.", fg="black")
+        self.stats_label.config(text="")
+        self.canvas.draw_idle()
+
+    def close_window(self):
+        self.stop_animation()
+        self.root.destroy()
@@ -0,0 +1,80 @@
+import numpy as np
+
+from Predicates import orient_arrays
+
+# All-pairs segment intersection over an (N, 4) array of x1, y1, x2, y2 rows.
+# The test is the CCW test from Lineintersection_ccw.py, vectorized with
+# NumPy broadcasting over blocks of rows so memory stays bounded. Segments
+# that only touch count as intersecting. Collinear segments intersect only
+# if they overlap, which the bounding-box check takes care of.
+
+DEFAULT_BLOCK_SIZE = 1 << 22  # pairs tested per block
+
+
+def as_segment_array(segments):
+    segs = np.ascontiguousarray(segments, dtype=np.float64)
+    if segs.ndim == 3 and segs.shape[1:] == (2, 2):
+        segs = segs.reshape(-1, 4)
+    if segs.ndim != 2 or segs.shape[1] != 4:
+        raise ValueError("segments must be an (N, 4) array, got shape %r" % (segs.shape,))
+    return segs
+
+
+def ccw(x1, y1, x2, y2, x3, y3):
+    # Same sign convention as Lineintersection_ccw.ccw: negative for a left turn
+    return -orient_arrays(x1, y1, x2, y2, x3, y3)
+
+
+def segments_intersect(a, b):
+    # Row-wise CCW test between two equally shaped (K, 4) arrays
+    ax1, ay1, ax2, ay2 = a.T
+    bx1, by1, bx2, by2 = b.T
+    # Multiply signs rather than values, which could underflow to zero
+    test1 = np.sign(ccw(ax1, ay1, ax2, ay2, bx1, by1)) * np.sign(ccw(ax1, ay1, ax2, ay2, bx2, by2))
+    test2 = np.sign(ccw(bx1, by1, bx2, by2, ax1, ay1)) * np.sign(ccw(bx1, by1, bx2, by2, ax2, ay2))
+    return (test1 <= 0) & (test2 <= 0)
+
+
+def _bounding_boxes(segs):
+    return np.column_stack((
+        np.minimum(segs[:, 0], segs[:, 2]), np.minimum(segs[:, 1], segs[:, 3]),
+        np.maximum(segs[:, 0], segs[:, 2]), np.maximum(segs[:, 1], segs[:, 3]),
+    ))
+
+
+def _block_pairs(segs, boxes, start, stop):
+    # Candidate pairs (i, j) with start <= i < stop and j > i whose bounding
+    # boxes overlap; the CCW test then only runs on those
+    a = boxes[start:stop]
+    b = boxes[start:]
+    overlap = (a[:, 0, None] <= b[:, 2]) & (b[:, 0] <= a[:, 2, None])
+    overlap &= (a[:, 1, None] <= b[:, 3]) & (b[:, 1] <= a[:, 3, None])
+    overlap &= np.arange(start, len(segs))[None, :] > np.arange(start, stop)[:, None]
+
+    i, j = np.nonzero(overlap)
+    i += start
+    j += start
+    hit = segments_intersect(segs[i], segs[j])
+    return i[hit], j[hit]
+
+
+def intersecting_pairs(segments, block_size=DEFAULT_BLOCK_SIZE):
+    # (K, 2) array of index pairs i < j whose segments intersect, sorted
+    segs = as_segment_array(segments)
+    n = len(segs)
+    boxes = _bounding_boxes(segs)
+    pairs = []
+
+    start = 0
+    while start < n - 1:
+        # Rows start..stop are tested against every later segment
+        rows = max(1, min(n - 1 - start, block_size // (n - start)))
+        stop = start + rows
+        i, j = _block_pairs(segs, boxes, start, stop)
+        pairs.append(np.column_stack((i, j)))
+        start = stop
+
+    if not pairs:
+        return np.empty((0, 2), dtype=np.intp)
+    return np.concatenate(pairs).astype(np.intp, copy=False)
+
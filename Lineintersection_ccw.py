@@ -1,21 +1,26 @@
-import tkinter as tk
-
-class Point:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+import Registry
+from Geometry import Point
+from Predicates import orient
 
 def ccw(p1, p2, p3):
-    return (p2.y - p1.y) * (p3.x - p2.x) - (p2.x - p1.x) * (p3.y - p2.y)
+    # Negative for a left turn, with an exact sign; see Predicates.py
+    return -orient((p1.x, p1.y), (p2.x, p2.y), (p3.x, p3.y))
+
+def sign(value):
+    return (value > 0) - (value < 0)
 
 def intersect(l1, l2):
-    test1 = ccw(l1[0], l1[1], l2[0]) * ccw(l1[0], l1[1], l2[1])
-    test2 = ccw(l2[0], l2[1], l1[0]) * ccw(l2[0], l2[1], l1[1])
+    # Multiply signs rather than values, which could underflow to zero
+    test1 = sign(ccw(l1[0], l1[1], l2[0])) * sign(ccw(l1[0], l1[1], l2[1]))
+    test2 = sign(ccw(l2[0], l2[1], l1[0])) * sign(ccw(l2[0], l2[1], l1[1]))
     return (test1 <= 0) and (test2 <= 0)
 
 class LineDrawer:
     def __init__(self, root):
+        import tkinter as tk
+
         self.root = root
+        self.root.title("Line Intersection Checker")
         self.canvas = tk.Canvas(root, width=400, height=400, bg="#001F3F")
         self.canvas.pack()
 
@@ -24,6 +29,11 @@ class LineDrawer:
 
         self.points = []
         self.lines = []
+        self.line_items = {}
+
+        # Imported here because Lineintersection_grid builds on this module
+        from Lineintersection_grid import SegmentGrid
+        self.grid = SegmentGrid()
 
         # Draw axes
         self.canvas.create_line(0, 200, 400, 200, fill="gray")  # Horizontal axis
@@ -37,13 +47,23 @@ class LineDrawer:
         self.draw_point(x, y)
 
         if len(self.points) == 2:
-            self.draw_line(self.points)
-            self.lines.append((self.points[0], self.points[1]))
+            item = self.draw_line(self.points)
+            line = (self.points[0], self.points[1])
             self.points = []
 
-            if len(self.lines) == 2:
-                if intersect(self.lines[0], self.lines[1]):
-                    self.show_result("Lines intersect!")
+            # Only lines sharing a grid cell with the new one are tested
+            hits = self.grid.intersecting(line)
+            self.line_items[self.grid.insert(line)] = item
+            self.lines.append(line)
+
+            for key in hits:
+                self.canvas.itemconfig(self.line_items[key], fill="yellow")
+            if hits:
+                self.canvas.itemconfig(item, fill="yellow")
+
+            if len(self.lines) >= 2:
+                if hits:
+                    self.show_result("Line intersects %d of %d lines!" % (len(hits), len(self.lines) - 1))
                 else:
                     self.show_result("Lines do not intersect!")
 
@@ -53,11 +73,11 @@ class LineDrawer:
     def draw_line(self, points):
         x1, y1 = points[0].x, points[0].y
         x2, y2 = points[1].x, points[1].y
-        self.canvas.create_line(x1, y1, x2, y2, fill="red")
+        return self.canvas.create_line(x1, y1, x2, y2, fill="red")
 
     def show_result(self, result):
-        self.canvas.create_text(200, 20, text=result, fill="green", font=("Helvetica", 12))
-        self.root.after(1000, self.reset)  # Reset after 2000 milliseconds (2 seconds)
+        self.canvas.delete("result")
+        self.canvas.create_text(200, 20, text=result, fill="green", font=("Helvetica", 12), tags="result")
 
     def reset(self):
         self.canvas.delete("all")
@@ -68,10 +88,15 @@ class LineDrawer:
 
         self.points = []
         self.lines = []
+        self.line_items = {}
+        self.grid.clear()
+
+Registry.register("line_intersection", "CCW", LineDrawer)
 
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
-    root.title("Line Intersection Checker")
 
     line_drawer = LineDrawer(root)
 
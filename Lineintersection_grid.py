@@ -0,0 +1,210 @@
+import math
+
+from Lineintersection_ccw import Point, intersect
+
+# Uniform-grid index over line segments. Every segment is rasterized into the
+# square cells it passes through, and a query only runs the CCW test from
+# Lineintersection_ccw.py against segments that share a cell with it. Two
+# intersecting segments always share the cell holding their intersection
+# point, so no pair is missed.
+#
+# Cells live in a dict, so only occupied cells cost memory. The cell size is
+# tuned to the mean segment extent: with cells about as large as a segment,
+# each segment covers a handful of cells and, for evenly spread segments, a
+# cell holds a constant number of them on average. As segments are inserted
+# the index is rebuilt whenever the mean extent drifts more than a factor of
+# two from the cell size, which keeps inserts amortized O(1).
+#
+# A segment far longer than the cells would cover more cells than there are
+# segments, so rasterizing it is capped: such a segment is stored in a short
+# list that every query checks, and such a query checks every stored segment.
+# With cells about the mean extent, at most a few segments can be that long.
+
+REBUILD_FACTOR = 2.0
+# Segments covering up to this many cells are always rasterized, so a small
+# index does not treat ordinary segments as long
+MIN_RASTER_CAP = 64
+
+
+def as_segment(segment):
+    # (Point, Point) from an x1, y1, x2, y2 tuple or a pair of points
+    if len(segment) == 4:
+        x1, y1, x2, y2 = segment
+        return Point(x1, y1), Point(x2, y2)
+    p, q = segment
+    if not hasattr(p, "x"):
+        p, q = Point(*p), Point(*q)
+    return p, q
+
+
+def _extent(segment):
+    p, q = segment
+    return max(abs(q.x - p.x), abs(q.y - p.y))
+
+
+def auto_cell_size(segments):
+    # Mean segment extent, or 1.0 when every segment is a point
+    segments = [as_segment(s) for s in segments]
+    total = sum(_extent(s) for s in segments)
+    return total / len(segments) if total > 0 else 1.0
+
+
+def _boxes_overlap(l1, l2):
+    return (min(l1[0].x, l1[1].x) <= max(l2[0].x, l2[1].x) and min(l2[0].x, l2[1].x) <= max(l1[0].x, l1[1].x)
+            and min(l1[0].y, l1[1].y) <= max(l2[0].y, l2[1].y) and min(l2[0].y, l2[1].y) <= max(l1[0].y, l1[1].y))
+
+
+def segments_intersect(l1, l2):
+    # The bounding-box check rules out collinear segments that do not overlap,
+    # which the CCW test alone reports as intersecting
+    return _boxes_overlap(l1, l2) and intersect(l1, l2)
+
+
+class SegmentGrid:
+    def __init__(self, segments=(), cell_size=None):
+        # A fixed cell_size disables tuning
+        self.fixed = cell_size is not None
+        self.cell_size = cell_size if cell_size is not None else 1.0
+        self.cells = {}
+        self.segments = {}
+        # Keys of the segments too long to rasterize
+        self.long_keys = set()
+        self.next_key = 0
+        self.extent_sum = 0.0
+
+        segments = [as_segment(s) for s in segments]
+        if not self.fixed and segments:
+            self.cell_size = auto_cell_size(segments)
+        for segment in segments:
+            self.insert(segment)
+
+    def __len__(self):
+        return len(self.segments)
+
+    def __contains__(self, key):
+        return key in self.segments
+
+    def cell_estimate(self, segment):
+        # About the number of cells cells_of yields: each column it crosses,
+        # plus each row it moves into
+        p, q = segment
+        return (abs(q.x - p.x) + abs(q.y - p.y)) / self.cell_size + 2
+
+    def is_long(self, segment):
+        return self.cell_estimate(segment) > max(len(self.segments), MIN_RASTER_CAP)
+
+    def cells_of(self, segment):
+        # Cells crossed by the segment, column by column. Within each column
+        # the segment spans a y-range, padded slightly so rounding in the
+        # clipped y values cannot drop a cell the segment touches.
+        p, q = segment
+        if (q.x, q.y) < (p.x, p.y):
+            p, q = q, p
+        size = self.cell_size
+        pad = size * 1e-9
+
+        first, last = math.floor(p.x / size), math.floor(q.x / size)
+        if first == last:
+            low, high = min(p.y, q.y), max(p.y, q.y)
+            for j in range(math.floor((low - pad) / size), math.floor((high + pad) / size) + 1):
+                yield first, j
+            return
+
+        slope = (q.y - p.y) / (q.x - p.x)
+        for i in range(first, last + 1):
+            x0 = max(p.x, i * size)
+            x1 = min(q.x, (i + 1) * size)
+            y0 = p.y + (x0 - p.x) * slope
+            y1 = p.y + (x1 - p.x) * slope
+            low, high = min(y0, y1), max(y0, y1)
+            for j in range(math.floor((low - pad) / size), math.floor((high + pad) / size) + 1):
+                yield i, j
+
+    def insert(self, segment):
+        # Add a segment and return the key it is stored under
+        segment = as_segment(segment)
+        key = self.next_key
+        self.next_key += 1
+        self.segments[key] = segment
+        self.extent_sum += _extent(segment)
+        # Tune first, so the segment is not rasterized at a cell size that is
+        # about to be replaced; a rebuild adds it along with the others
+        if not self.retune():
+            self._add(key, segment)
+        return key
+
+    def _add(self, key, segment):
+        if self.is_long(segment):
+            self.long_keys.add(key)
+            return
+        for cell in self.cells_of(segment):
+            self.cells.setdefault(cell, set()).add(key)
+
+    def delete(self, key):
+        segment = self.segments.pop(key)
+        self.extent_sum -= _extent(segment)
+        if key in self.long_keys:
+            self.long_keys.discard(key)
+        else:
+            for cell in self.cells_of(segment):
+                bucket = self.cells[cell]
+                bucket.discard(key)
+                if not bucket:
+                    del self.cells[cell]
+        if not self.segments:
+            self.extent_sum = 0.0
+
+    def clear(self):
+        self.cells = {}
+        self.segments = {}
+        self.long_keys = set()
+        self.extent_sum = 0.0
+
+    def retune(self):
+        # Returns whether the index was rebuilt
+        if self.fixed or not self.segments or self.extent_sum <= 0:
+            return False
+        target = self.extent_sum / len(self.segments)
+        if target > self.cell_size * REBUILD_FACTOR or target * REBUILD_FACTOR < self.cell_size:
+            self.rebuild(target)
+            return True
+        return False
+
+    def rebuild(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.long_keys = set()
+        for key, segment in self.segments.items():
+            self._add(key, segment)
+
+    def candidates(self, segment):
+        # Keys of the stored segments sharing at least one cell with segment,
+        # plus the long ones; every key if segment is long itself
+        segment = as_segment(segment)
+        if self.is_long(segment):
+            return set(self.segments)
+        found = set(self.long_keys)
+        for cell in self.cells_of(segment):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found |= bucket
+        return found
+
+    def intersecting(self, segment):
+        # Sorted keys of the stored segments that intersect segment
+        segment = as_segment(segment)
+        return sorted(key for key in self.candidates(segment) if segments_intersect(segment, self.segments[key]))
+
+
+def intersecting_pairs(segments, cell_size=None):
+    # Sorted list of index pairs (i, j), i < j, of intersecting segments
+    segments = [as_segment(s) for s in segments]
+    if cell_size is None and segments:
+        cell_size = auto_cell_size(segments)
+    grid = SegmentGrid(cell_size=cell_size)
+    pairs = []
+    for i, segment in enumerate(segments):
+        # Keys follow insertion order, so key j is segments[j]
+        pairs.extend((j, i) for j in grid.intersecting(segment))
+        grid.insert(segment)
+    return sorted(pairs)
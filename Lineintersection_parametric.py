@@ -1,11 +1,7 @@
-import tkinter as tk
+import Registry
+from Geometry import Point
 
-class Point:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-def parametric_intersect(l1, l2):
+def parametric_intersection_point(l1, l2):
     x1, y1 = l1[0].x, l1[0].y
     x2, y2 = l1[1].x, l1[1].y
     x3, y3 = l2[0].x, l2[0].y
@@ -14,16 +10,24 @@ def parametric_intersect(l1, l2):
     denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
 
     if denominator == 0:
-        return False  # Lines are parallel
+        return None  # Lines are parallel
 
     t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denominator
     u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denominator
 
-    return 0 <= t <= 1 and 0 <= u <= 1
+    if 0 <= t <= 1 and 0 <= u <= 1:
+        return x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+    return None
+
+def parametric_intersect(l1, l2):
+    return parametric_intersection_point(l1, l2) is not None
 
 class LineDrawer:
     def __init__(self, root):
+        import tkinter as tk
+
         self.root = root
+        self.root.title("Line Intersection Checker")
         self.canvas = tk.Canvas(root, width=500, height=500, bg="#001F3F")  # Light blue background color
         self.canvas.pack()
 
@@ -77,9 +81,12 @@ class LineDrawer:
         self.points = []
         self.lines = []
 
+Registry.register("line_intersection", "Parametric", LineDrawer)
+
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
-    root.title("Line Intersection Checker")
 
     line_drawer = LineDrawer(root)
 
@@ -1,9 +1,5 @@
-import tkinter as tk
-
-class CustomPoint:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
+import Registry
+from Geometry import Point as CustomPoint
 
 def calculate_slope(p1, p2):
     if p2.x - p1.x == 0:
@@ -39,7 +35,10 @@ def check_intersection(line1, line2):
 
 class LineDrawerApp:
     def __init__(self, root):
+        import tkinter as tk
+
         self.root = root
+        self.root.title("Custom Slope Method")
         self.canvas = tk.Canvas(root, width=400, height=400, bg="#001F3F")  # Pastel background color
         self.canvas.pack()
 
@@ -93,9 +92,12 @@ class LineDrawerApp:
         self.custom_points = []
         self.custom_lines = []
 
+Registry.register("line_intersection", "Slope", LineDrawerApp)
+
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
-    root.title("Custom Slope Method")
 
     app = LineDrawerApp(root)
 
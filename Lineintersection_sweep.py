@@ -0,0 +1,263 @@
+import heapq
+import random
+from fractions import Fraction
+from functools import cmp_to_key
+
+from Lineintersection_ccw import Point, ccw, intersect
+from Lineintersection_parametric import parametric_intersection_point
+from Predicates import orient_exact
+
+# Bentley-Ottmann sweep reporting every intersection among n segments in
+# O((n + k) log n). The sweep line moves left to right; events are segment
+# endpoints and intersection points, ordered by x and then y. The status
+# holds the segments crossing the sweep line from bottom to top in a treap.
+#
+# Endpoints are kept as floats, so the event order and the ccw tests between
+# them take the float filter of Predicates.py. Intersection points are
+# computed exactly as Fractions, so events never come out of order, and the
+# ccw tests against them are made in Fractions too. Segments that only touch,
+# and overlapping collinear segments, are reported too.
+
+
+def _as_segment(segment):
+    if len(segment) == 4:
+        (x1, y1, x2, y2) = segment
+    else:
+        p, q = segment
+        x1, y1 = (p.x, p.y) if hasattr(p, "x") else p
+        x2, y2 = (q.x, q.y) if hasattr(q, "x") else q
+    a = Point(float(x1), float(y1))
+    b = Point(float(x2), float(y2))
+    # Orient every segment from its left (then lower) endpoint
+    return (a, b) if (a.x, a.y) <= (b.x, b.y) else (b, a)
+
+
+def _key(p):
+    return p.x, p.y
+
+
+def _ccw(a, b, p):
+    # ccw against an event point. Mixing Fractions with floats would round
+    # them, so intersection points are tested exactly.
+    if type(p.x) is float:
+        return ccw(a, b, p)
+    return -orient_exact((a.x, a.y), (b.x, b.y), (p.x, p.y))
+
+
+def _side(s, p):
+    # -1 if p is below segment s on the sweep line, 1 if above, 0 if on it
+    c = _ccw(s[0], s[1], p)
+    if c > 0:
+        return -1
+    if c < 0:
+        return 1
+    if s[0].x == s[1].x:
+        if p.y < s[0].y:
+            return -1
+        if p.y > s[1].y:
+            return 1
+    return 0
+
+
+def _compare_after(s, t):
+    # Order of two segments through the same point just right of it; vertical
+    # segments come last
+    c = ccw(t[0], t[1], s[1])
+    return -1 if c > 0 else 1 if c < 0 else 0
+
+
+def _crossing_point(s, t):
+    # The exact point where two segments cross, or None if they do not meet
+    # or are collinear. The float test rules out most pairs before any
+    # Fractions are made.
+    if not intersect(s, t):
+        return None
+    s, t = [tuple(Point(Fraction(p.x), Fraction(p.y)) for p in segment) for segment in (s, t)]
+    return parametric_intersection_point(s, t)
+
+
+class _Node:
+    __slots__ = ("index", "priority", "left", "right", "parent")
+
+    def __init__(self, index):
+        self.index = index
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.parent = None
+
+
+class _StatusTree:
+    # Treap of segment indices in sweep-line order, with parent links so
+    # neighbours can be found from a node
+    def __init__(self, segments):
+        self.segments = segments
+        self.root = None
+
+    def first(self, before):
+        # Leftmost node for which before(segment) holds, given that it holds
+        # for a suffix of the order
+        node, found = self.root, None
+        while node is not None:
+            if before(self.segments[node.index]):
+                found, node = node, node.left
+            else:
+                node = node.right
+        return found
+
+    def last(self):
+        node = self.root
+        while node is not None and node.right is not None:
+            node = node.right
+        return node
+
+    @staticmethod
+    def successor(node):
+        if node.right is not None:
+            node = node.right
+            while node.left is not None:
+                node = node.left
+            return node
+        while node.parent is not None and node.parent.right is node:
+            node = node.parent
+        return node.parent
+
+    @staticmethod
+    def predecessor(node):
+        if node.left is not None:
+            node = node.left
+            while node.right is not None:
+                node = node.right
+            return node
+        while node.parent is not None and node.parent.left is node:
+            node = node.parent
+        return node.parent
+
+    def _replace(self, node, child):
+        if node.parent is None:
+            self.root = child
+        elif node.parent.left is node:
+            node.parent.left = child
+        else:
+            node.parent.right = child
+        if child is not None:
+            child.parent = node.parent
+
+    def _rotate_up(self, node):
+        parent = node.parent
+        self._replace(parent, node)
+        if parent.left is node:
+            parent.left = node.right
+            if node.right is not None:
+                node.right.parent = parent
+            node.right = parent
+        else:
+            parent.right = node.left
+            if node.left is not None:
+                node.left.parent = parent
+            node.left = parent
+        parent.parent = node
+
+    def insert_before(self, target, index):
+        # Insert index immediately before node target, or at the end if None
+        node = _Node(index)
+        if self.root is None:
+            self.root = node
+            return node
+        if target is None:
+            parent = self.last()
+            parent.right = node
+        elif target.left is None:
+            parent = target
+            parent.left = node
+        else:
+            parent = self.predecessor(target)
+            parent.right = node
+        node.parent = parent
+        while node.parent is not None and node.priority < node.parent.priority:
+            self._rotate_up(node)
+        return node
+
+    def delete(self, node):
+        while node.left is not None and node.right is not None:
+            child = node.left if node.left.priority < node.right.priority else node.right
+            self._rotate_up(child)
+        self._replace(node, node.left if node.left is not None else node.right)
+
+
+def find_intersections(segments):
+    # List of (point, segment indices) for every intersection point, in sweep
+    # order. Points are returned as float (x, y) tuples.
+    segs = [_as_segment(s) for s in segments]
+
+    # Event queue: a heap of points plus the segments starting at each one
+    starts = {}
+    queue = []
+    for i, (a, b) in enumerate(segs):
+        for p in (a, b):
+            if _key(p) not in starts:
+                starts[_key(p)] = []
+                heapq.heappush(queue, _key(p))
+        starts[_key(a)].append(i)
+
+    status = _StatusTree(segs)
+    nodes = {}
+    reports = []
+
+    def find_new_event(lower, upper, p):
+        if lower is None or upper is None:
+            return
+        point = _crossing_point(segs[lower.index], segs[upper.index])
+        if point is not None and point > _key(p) and point not in starts:
+            starts[point] = []
+            heapq.heappush(queue, point)
+
+    while queue:
+        # Events are float endpoints or exact Fraction intersection points;
+        # Python compares the two exactly, and equal ones hash alike
+        x, y = heapq.heappop(queue)
+        p = Point(x, y)
+        upper_set = starts.pop((x, y))
+
+        # Segments in the status that contain p are contiguous
+        containing = []
+        node = status.first(lambda s: _side(s, p) <= 0)
+        while node is not None and _side(segs[node.index], p) == 0:
+            containing.append(node.index)
+            node = status.successor(node)
+
+        involved = set(upper_set).union(containing)
+        if len(involved) > 1:
+            reports.append(((float(x), float(y)), sorted(involved)))
+
+        for i in containing:
+            status.delete(nodes.pop(i))
+
+        # Segments continuing past p, from bottom to top just right of it;
+        # zero-length segments end where they start
+        passing = [i for i in involved if _key(segs[i][1]) > (x, y)]
+        passing.sort(key=cmp_to_key(lambda i, j: _compare_after(segs[i], segs[j])))
+
+        above = status.first(lambda s: _side(s, p) < 0)
+        if not passing:
+            below = status.predecessor(above) if above is not None else status.last()
+            find_new_event(below, above, p)
+            continue
+
+        for i in passing:
+            nodes[i] = status.insert_before(above, i)
+        lowest, highest = nodes[passing[0]], nodes[passing[-1]]
+        find_new_event(status.predecessor(lowest), lowest, p)
+        find_new_event(highest, status.successor(highest), p)
+
+    return reports
+
+
+def intersecting_pairs(segments):
+    # Sorted list of index pairs (i, j), i < j, of intersecting segments
+    pairs = set()
+    for _, indices in find_intersections(segments):
+        for a in range(len(indices)):
+            for b in range(a + 1, len(indices)):
+                pairs.add((indices[a], indices[b]))
+    return sorted(pairs)
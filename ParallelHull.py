@@ -0,0 +1,79 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+import ArrayHull
+
+# Parallel hull for very large point sets. The (N, 2) array is copied once
+# into shared memory, each worker process computes the hull of one slice of
+# it with ArrayHull.monotone_chain_indices, and a final monotone chain over
+# the union of the local hull vertices gives the hull of the whole set. Only
+# the shared memory block's name and the slice bounds are sent to the
+# workers, and only the local hull indices come back.
+
+# Below this many points per worker the process overhead outweighs the work
+MIN_CHUNK = 100_000
+
+
+def make_executor(workers=None):
+    # Before Python 3.13, a worker that attaches to a shared memory block
+    # registers it with its resource tracker. Starting the tracker before
+    # the pool lets the workers share the parent's, which forgets the block
+    # when the parent unlinks it. Workers forked before the tracker started
+    # would start their own and warn about leaked blocks when they exit.
+    resource_tracker.ensure_running()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _chunk_hull(name, shape, start, stop):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        pts = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        hull = ArrayHull.monotone_chain_indices(pts[start:stop]) + start
+        # Drop the view before closing, as the buffer cannot be released
+        # while it is still referenced
+        del pts
+        return hull
+    finally:
+        shm.close()
+
+
+def parallel_hull_indices(points, workers=None, executor=None, chunks=None):
+    # executor may be a pool from make_executor, to avoid starting new
+    # processes on every call. chunks defaults to one slice per worker.
+    pts = ArrayHull.as_point_array(points)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunks is None:
+        chunks = workers
+    chunks = max(1, min(chunks, len(pts) // MIN_CHUNK))
+    if workers == 1 or chunks == 1:
+        return ArrayHull.monotone_chain_indices(pts)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = make_executor(workers)
+    shm = shared_memory.SharedMemory(create=True, size=pts.nbytes)
+    try:
+        shared = np.ndarray(pts.shape, dtype=np.float64, buffer=shm.buf)
+        shared[:] = pts
+        del shared
+
+        bounds = np.linspace(0, len(pts), chunks + 1).astype(np.intp)
+        futures = [executor.submit(_chunk_hull, shm.name, pts.shape, start, stop)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        candidates = np.concatenate([f.result() for f in futures])
+    finally:
+        if own_executor:
+            executor.shutdown()
+        shm.close()
+        shm.unlink()
+
+    return candidates[ArrayHull.monotone_chain_indices(pts[candidates])]
+
+
+def parallel_hull(points, workers=None, executor=None, chunks=None):
+    pts = ArrayHull.as_point_array(points)
+    return pts[parallel_hull_indices(pts, workers, executor, chunks)]
@@ -0,0 +1,108 @@
+import time
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+# Controls that fill a visualizer with many points at once, generated by one
+# of the Datasets distributions or read from a CSV, .npy or raw float64 file
+# by Datasets.load. The points are scaled into the visualizer's plot area and
+# handed to its callback as one (N, 2) float64 array. NumPy, Datasets and
+# ArrayHull are imported on first use, so the GUI modules load without them.
+
+GENERATORS = ["uniform", "gaussian", "circle", "clustered"]
+
+# Above this many points the visualizers compute the hull with ArrayHull and
+# draw the result instead of animating the step generators
+ANIMATE_LIMIT = 2_000
+
+
+def fit(points, bounds, margin=0.05):
+    # Scale and translate points, keeping their aspect ratio, to the centre
+    # of the box bounds = (x0, y0, x1, y1)
+    import numpy as np
+    x0, y0, x1, y1 = bounds
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(pts) == 0:
+        return pts
+    low, high = pts.min(axis=0), pts.max(axis=0)
+    extent = (high - low).max() or 1.0
+    scale = (1 - 2 * margin) * min(x1 - x0, y1 - y0) / extent
+    centre = np.array([(x0 + x1) / 2, (y0 + y1) / 2])
+    return centre + (pts - (low + high) / 2) * scale
+
+
+def no_points():
+    import numpy as np
+    return np.empty((0, 2))
+
+
+def append_point(points, point):
+    import numpy as np
+    return np.vstack((points, point))
+
+
+def point_tuples(points):
+    # The (x, y) tuples the ConvexHull functions and step generators take
+    return [tuple(p) for p in points.tolist()]
+
+
+def array_hull(name, points):
+    # Hull vertices from the ArrayHull *_indices function of that name, and
+    # the seconds it took
+    import ArrayHull
+    function = getattr(ArrayHull, name)
+    start = time.perf_counter()
+    hull = points[function(points)]
+    return hull, time.perf_counter() - start
+
+
+def array_hull_text(name, points, hull, seconds):
+    return "n = %d, h = %d: ArrayHull.%s in %.1f ms" % (len(points), len(hull), name, 1e3 * seconds)
+
+
+class PointPanel:
+    def __init__(self, master, on_points, bounds, n=1000, seed=0):
+        self.on_points = on_points
+        self.bounds = bounds
+        self.seed = seed
+
+        self.frame = tk.Frame(master)
+        self.dataset_var = tk.StringVar(master, value=GENERATORS[0])
+        tk.OptionMenu(self.frame, self.dataset_var, *GENERATORS).pack(side=tk.LEFT)
+        tk.Label(self.frame, text="N").pack(side=tk.LEFT)
+        self.n_var = tk.StringVar(master, value=str(n))
+        tk.Entry(self.frame, textvariable=self.n_var, width=8).pack(side=tk.LEFT)
+        tk.Button(self.frame, text="Generate", command=self.generate).pack(side=tk.LEFT, padx=5)
+        tk.Button(self.frame, text="Load File...", command=self.load_file).pack(side=tk.LEFT)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def generate(self):
+        try:
+            n = int(self.n_var.get())
+        except ValueError:
+            n = 0
+        if n < 1:
+            messagebox.showerror("Generate Points", "N must be a positive whole number.")
+            return
+        import Datasets
+        # A new seed each time, so Generate can be pressed again for another set
+        self.seed += 1
+        self.on_points(fit(Datasets.points(self.dataset_var.get(), n, self.seed), self.bounds))
+
+    def load_file(self):
+        path = filedialog.askopenfilename(
+            title="Load Points",
+            filetypes=[("Point files", "*.csv *.txt *.npy"), ("All files", "*")])
+        if not path:
+            return
+        import numpy as np
+        import Datasets
+        try:
+            pts = Datasets.load(path, 2)
+            if not np.isfinite(pts).all():
+                raise ValueError("%s: coordinates must be finite numbers" % (path,))
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Points", str(e))
+            return
+        self.on_points(fit(pts, self.bounds))
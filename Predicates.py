@@ -0,0 +1,75 @@
+from fractions import Fraction
+
+# Orientation predicate shared by the hull and intersection modules.
+#
+# orient(o, a, b) is the cross product of o -> a and o -> b: positive if
+# o -> a -> b turns counter-clockwise, negative if clockwise, zero if the three
+# points are collinear. The float result is only trusted when it is larger
+# than a bound on its rounding error (Shewchuk's orient2d filter); otherwise
+# the product is recomputed exactly with Fractions. Nearly collinear inputs
+# thus get consistent signs, and almost every call takes the float path.
+
+EPSILON = 2.0 ** -53
+# Relative error bound of the float cross product, from Shewchuk, "Adaptive
+# Precision Floating-Point Arithmetic and Fast Robust Geometric Predicates"
+CCW_ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+# That bound assumes no underflow. A product below the normal range is off
+# by at most half the smallest subnormal instead, so the filter also allows
+# for twice that. A float result of 0 thus always goes to the exact path.
+UNDERFLOW_ERRBOUND = 2.0 ** -1074
+
+
+def orient_exact(o, a, b):
+    if type(o[0]) is type(o[1]) is type(a[0]) is type(a[1]) is type(b[0]) is type(b[1]) is float:
+        # A float is an integer over a power of two, so over their common
+        # denominator the six coordinates are integers, and integer arithmetic
+        # is much faster than Fractions
+        ratios = [v.as_integer_ratio() for v in (o[0], o[1], a[0], a[1], b[0], b[1])]
+        denominator = max(d for _, d in ratios)
+        ox, oy, ax, ay, bx, by = [n * (denominator // d) for n, d in ratios]
+        det = (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+        return Fraction(det, denominator * denominator)
+
+    ox, oy = Fraction(o[0]), Fraction(o[1])
+    return (Fraction(a[0]) - ox) * (Fraction(b[1]) - oy) - (Fraction(a[1]) - oy) * (Fraction(b[0]) - ox)
+
+
+def orient(o, a, b):
+    detleft = (a[0] - o[0]) * (b[1] - o[1])
+    detright = (a[1] - o[1]) * (b[0] - o[0])
+    det = detleft - detright
+    # Rounded coordinate differences keep their signs, so when the products
+    # have opposite signs det cannot have the wrong sign, and it is then
+    # larger than |detleft + detright| anyway. Otherwise that sum bounds the
+    # rounding error.
+    if abs(det) > CCW_ERRBOUND * abs(detleft + detright) + UNDERFLOW_ERRBOUND:
+        return det
+    return orient_exact(o, a, b)
+
+
+def _signed_float(value):
+    # Nearest float with the sign of an exact value, even where it underflows
+    f = float(value)
+    if f == 0 and value != 0:
+        return 5e-324 if value > 0 else -5e-324
+    return f
+
+
+def orient_arrays(ox, oy, ax, ay, bx, by):
+    # orient over broadcast NumPy coordinate arrays. Entries that fail the
+    # filter are recomputed exactly and replaced by a float of the same sign.
+    import numpy as np
+
+    detleft = (ax - ox) * (by - oy)
+    detright = (ay - oy) * (bx - ox)
+    det = detleft - detright
+    uncertain = np.abs(det) <= CCW_ERRBOUND * np.abs(detleft + detright) + UNDERFLOW_ERRBOUND
+    if not uncertain.any():
+        return det
+
+    det = np.array(det, dtype=np.float64)
+    coords = np.broadcast_arrays(ox, oy, ax, ay, bx, by, det)[:6]
+    for i in zip(*np.nonzero(uncertain)):
+        x0, y0, x1, y1, x2, y2 = (float(c[i]) for c in coords)
+        det[i] = _signed_float(orient_exact((x0, y0), (x1, y1), (x2, y2)))
+    return det
@@ -1,28 +1,42 @@
 import tkinter as tk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
-import time
+import ConvexHull
+import Registry
+from HullApp import LivePoints
+from PointPanel import PointPanel, point_tuples
+from StepPlayer import AxesLine, AxesRenderer, StepPlayer
 
 
-class QuickHullGUI:
+class QuickHullGUI(LivePoints):
     def __init__(self, master):
         self.master = master
         self.master.title("QuickHull Convex Hull Finder")
 
-        self.points = []
+        self.clear_live_points()
         self.convex_hull = []
+        self.player = None
+        self.restore_id = None
 
         self.create_widgets()
 
+        self.master.protocol("WM_DELETE_WINDOW", self.close_window)
+
     def create_widgets(self):
         self.canvas_frame = tk.Frame(self.master)
         self.canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        # Imported here so that importing this module does not load matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
         self.fig = Figure(figsize=(5, 5), dpi=100)
         self.ax = self.fig.add_subplot(111)
         self.ax.set_xlim(0, 10)
         self.ax.set_ylim(0, 10)
+        # One artist each for the points, the live hull and the final hull,
+        # updated in place
+        self.point_markers = AxesLine(self.ax, 'ro')
+        self.live_line = AxesLine(self.ax, 'k:', closed=True)
+        self.hull_line = AxesLine(self.ax, 'g-', closed=True)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas_frame)
         self.canvas_widget = self.canvas.get_tk_widget()
@@ -36,15 +50,31 @@ class QuickHullGUI:
         self.compute_button = tk.Button(self.master, text="Compute Convex Hull", command=self.compute_convex_hull)
         self.compute_button.pack(side=tk.BOTTOM)
 
+        self.stats_label = tk.Label(self.master, text="", wraplength=200, justify=tk.LEFT)
+        self.stats_label.pack(side=tk.BOTTOM)
+
+        self.point_panel = PointPanel(self.master, self.set_points, (0, 0, 10, 10))
+        self.point_panel.pack(side=tk.BOTTOM, pady=5)
+
         self.animating = False
 
     def clear_points(self):
-        self.points = []
+        self.clear_live_points()
         self.convex_hull = []
+        self.stats_label.config(text="")
         self.ax.clear()
         self.ax.set_xlim(0, 10)
         self.ax.set_ylim(0, 10)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+
+    def set_points(self, points):
+        if self.animating:
+            return
+        self.clear_points()
+        self.set_live_points(points)
+        self.point_markers.set_points(points)
+        self.live_line.set_points(self.live_hull.vertices())
+        self.canvas.draw_idle()
 
     def on_click(self, event):
         if self.animating:
@@ -52,90 +82,75 @@ class QuickHullGUI:
 
         x, y = event.xdata, event.ydata
         if x is not None and y is not None:
-            self.points.append((x, y))
-            self.ax.plot(x, y, 'ro')
-            self.canvas.draw()
+            self.add_live_point((x, y))
+            self.point_markers.set_points(self.points)
+            self.live_line.set_points(self.live_hull.vertices())
+            self.canvas.draw_idle()
 
     def compute_convex_hull(self):
         if self.animating or len(self.points) < 3:
             return
 
+        # Drop the previous run's animation and hull artists
+        self.ax.clear()
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 10)
+        self.point_markers.set_points(self.points)
+        self.live_line.set_points(self.live_hull.vertices())
+
+        if self.too_many_to_animate():
+            hull, text = self.hull_at_once()
+            self.convex_hull = point_tuples(hull)
+            self.stats_label.config(text=text)
+            self.plot_convex_hull()
+            return
+
         self.animating = True
         self.compute_button.config(state=tk.DISABLED)
         self.clear_button.config(state=tk.DISABLED)
 
-        self.convex_hull = quick_hull(self.points, self.ax)
+        # Animate the algorithm's partial hulls from the Tk event loop instead
+        # of drawing and sleeping inside the algorithm
+        steps = ConvexHull.quick_hull_steps(point_tuples(self.points))
+        renderer = AxesRenderer(self.ax, self.canvas, hull_style=None, closed=True)
+        self.player = StepPlayer(self.master, steps, renderer, fps=2, on_done=self.hull_found).start()
+
+    def hull_found(self, state):
+        self.convex_hull = state.hull
+        stats = ConvexHull.HullStats()
+        quick_hull(point_tuples(self.points), stats=stats)
+        self.stats_label.config(text=str(stats))
         self.plot_convex_hull()
+        # Only the animation disabled the interface
+        self.restore_id = self.master.after(1000, self.restore_interface)
 
     def plot_convex_hull(self):
         if not self.convex_hull:
             return
 
-        hull_points = np.array(self.convex_hull + [self.convex_hull[0]])
-        x, y = hull_points[:, 0], hull_points[:, 1]
-        self.ax.plot(x, y, 'g-')
-        self.canvas.draw()
-
-        self.master.after(1000, self.restore_interface)
+        self.hull_line.set_points(self.convex_hull)
+        self.canvas.draw_idle()
 
     def restore_interface(self):
+        self.restore_id = None
         self.compute_button.config(state=tk.NORMAL)
         self.clear_button.config(state=tk.NORMAL)
         self.animating = False
 
+    def close_window(self):
+        if self.player is not None:
+            self.player.stop()
+        if self.restore_id is not None:
+            self.master.after_cancel(self.restore_id)
+            self.restore_id = None
+        self.master.destroy()
+
+
+def quick_hull(points, prefilter=False, stats=None):
+    return ConvexHull.quick_hull(points, prefilter=prefilter, stats=stats)
+
 
-def quick_hull(points, ax):
-    def get_orientation(p, q, r):
-        val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
-        if val == 0:
-            return 0  # Collinear
-        return 1 if val > 0 else 2  # Clockwise or counterclockwise
-
-    def hull_recursive(points, p, q, hull_set):
-        max_dist = 0
-        farthest_point = None
-        for r in points:
-            d = get_orientation(p, q, r)
-            if d == 2:
-                dist = (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
-                if dist > max_dist:
-                    max_dist = dist
-                    farthest_point = r
-
-        if farthest_point is not None:
-            hull_recursive(points, p, farthest_point, hull_set)
-            hull_set.append(farthest_point)
-            hull_recursive(points, farthest_point, q, hull_set)
-
-            hull_points = np.array(hull_set + [hull_set[0]])
-            x, y = hull_points[:, 0], hull_points[:, 1]
-            ax.plot(x, y, 'g-')
-            ax.set_xlim(0, 10)
-            ax.set_ylim(0, 10)
-            ax.figure.canvas.draw()
-            time.sleep(0.5)
-
-    points.sort()
-    if len(points) < 3:
-        return points
-
-    hull = []
-    hull.append(points[0])
-    hull.append(points[-1])
-
-    upper_hull = []
-    lower_hull = []
-    for point in points:
-        orientation = get_orientation(hull[0], hull[-1], point)
-        if orientation == 2:
-            upper_hull.append(point)
-        elif orientation == 1:
-            lower_hull.append(point)
-
-    hull_recursive(upper_hull, hull[0], hull[-1], hull)
-    hull_recursive(lower_hull, hull[-1], hull[0], hull)
-
-    return hull
+Registry.register("convex_hull", "Quick Hull", QuickHullGUI)
 
 
 def main():
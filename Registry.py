@@ -0,0 +1,51 @@
+import importlib
+
+# Visualizers by the algorithm and sub-algorithm names index.py shows. Each
+# GUI module registers the class (or function) that builds its window inside
+# a given Tk root or Toplevel, e.g.
+#
+#   Registry.register("convex_hull", "Graham Scan", ConvexHullApp)
+#
+# load_plugins() imports the modules in PLUGINS so they can register; a new
+# visualizer only needs its module added there.
+
+PLUGINS = [
+    "BruteForce",
+    "GrahamScan",
+    "JarvisMarch",
+    "QuickHull",
+    "MonotoneChain",
+    "Lineintersection_parametric",
+    "Lineintersection_slope",
+    "Lineintersection_ccw",
+]
+
+# algorithm -> {name: factory}, in registration order
+_visualizers = {}
+
+
+def register(algorithm, name, factory):
+    _visualizers.setdefault(algorithm, {})[name] = factory
+    return factory
+
+
+def load_plugins(modules=PLUGINS):
+    for module in modules:
+        importlib.import_module(module)
+
+
+def algorithms():
+    return list(_visualizers)
+
+
+def names(algorithm):
+    return list(_visualizers.get(algorithm, ()))
+
+
+def open_window(algorithm, name, master):
+    # Builds the visualizer in master and returns it
+    try:
+        factory = _visualizers[algorithm][name]
+    except KeyError:
+        raise ValueError("Unknown visualizer: %r / %r" % (algorithm, name)) from None
+    return factory(master)
@@ -0,0 +1,194 @@
+import time
+
+# Plays the step events yielded by the ConvexHull *_steps generators. Events
+# are (kind, data) tuples:
+#
+#   ("push", point)    point appended to the working chain
+#   ("pop", point)     last point removed from the working chain
+#   ("hull", points)   working chain replaced by a partial hull
+#   ("test", points)   points being compared (an edge or a triangle)
+#   ("accept", edge)   (p, q) confirmed as a hull edge
+#   ("done", hull)     final hull, always the last event
+#
+# The player applies events to a TraceState and calls a renderer with it at
+# a fixed frame rate. Events that arrive between frames are applied without
+# being drawn, the number of events per frame doubles every `ramp` seconds,
+# and whatever is left after `duration` seconds is applied at once, so even
+# very long traces finish in bounded wall time. Nothing here imports a GUI
+# toolkit: the widget only needs Tk's after/after_cancel.
+
+
+class TraceState:
+    def __init__(self):
+        self.chain = []
+        self.test = None
+        self.edges = []
+        self.hull = None
+        self.events = 0
+
+    def apply(self, event):
+        kind, data = event
+        if kind == "push":
+            self.chain.append(data)
+        elif kind == "pop":
+            self.chain.pop()
+        elif kind == "hull":
+            self.chain = list(data)
+        elif kind == "test":
+            self.test = data
+        elif kind == "accept":
+            self.edges.append(data)
+        elif kind == "done":
+            self.hull = data
+            self.test = None
+        else:
+            raise ValueError("Unknown step event: %r" % (kind,))
+        self.events += 1
+
+
+class StepPlayer:
+    def __init__(self, widget, steps, render, fps=30, duration=10.0, ramp=1.0, on_done=None):
+        self.widget = widget
+        self.steps = iter(steps)
+        self.render = render
+        self.fps = fps
+        self.duration = duration
+        self.ramp = ramp
+        self.on_done = on_done
+
+        self.state = TraceState()
+        self.frames = 0
+        self.started = None
+        self.after_id = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.tick()
+        return self
+
+    def stop(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def advance(self, count):
+        # Apply up to count events, or all of them if count is None. Returns
+        # False once the trace is exhausted.
+        if count == 0:
+            return True
+        applied = 0
+        for event in self.steps:
+            self.state.apply(event)
+            applied += 1
+            if applied == count:
+                return True
+        return False
+
+    def tick(self):
+        self.after_id = None
+        frame_start = time.perf_counter()
+        elapsed = frame_start - self.started
+
+        if elapsed >= self.duration:
+            running = self.advance(None)
+        else:
+            # Frames that rendering has fallen behind on are skipped, and
+            # their events are played in this one
+            due = int(elapsed * self.fps) + 1
+            per_frame = 2 ** int(elapsed / self.ramp)
+            running = self.advance(per_frame * (due - self.frames))
+            self.frames = due
+
+        self.render(self.state)
+
+        if not running:
+            if self.on_done is not None:
+                self.on_done(self.state)
+            return
+
+        next_frame = self.started + (self.frames / self.fps)
+        delay = max(1, int(1000 * (next_frame - time.perf_counter())))
+        self.after_id = self.widget.after(delay, self.tick)
+
+
+def _polyline(points):
+    return [p[0] for p in points], [p[1] for p in points]
+
+
+def _segments(edges):
+    xs = []
+    ys = []
+    for p, q in edges:
+        xs += [p[0], q[0], float("nan")]
+        ys += [p[1], q[1], float("nan")]
+    return xs, ys
+
+
+class AxesRenderer:
+    # Draws a TraceState on a matplotlib Axes by updating a fixed set of
+    # artists in place
+    def __init__(self, ax, canvas, chain_style="g-", test_style="y--", edge_style="r-", hull_style="r-", closed=False):
+        self.canvas = canvas
+        self.closed = closed
+        self.chain_line, = ax.plot([], [], chain_style)
+        self.test_line, = ax.plot([], [], test_style)
+        self.edge_lines, = ax.plot([], [], edge_style)
+        # hull_style=None leaves drawing the final hull to the caller
+        self.hull_line = ax.plot([], [], hull_style)[0] if hull_style is not None else None
+
+    def __call__(self, state):
+        chain = state.chain + state.chain[:1] if self.closed else state.chain
+        self.chain_line.set_data(*_polyline(chain))
+        self.test_line.set_data(*_polyline(state.test or []))
+        self.edge_lines.set_data(*_segments(state.edges))
+        if self.hull_line is not None:
+            hull = state.hull or []
+            self.hull_line.set_data(*_polyline(hull + hull[:1]))
+        self.canvas.draw_idle()
+
+
+class AxesLine:
+    # A single Line2D on a matplotlib Axes whose data is replaced in place,
+    # so redrawing costs the same however often it is updated. It is added
+    # again if the Axes were cleared since the last update.
+    def __init__(self, ax, style, closed=False, **kwargs):
+        self.ax = ax
+        self.style = style
+        self.closed = closed
+        self.kwargs = kwargs
+        self.line = None
+
+    def set_points(self, points):
+        if self.line is None or self.line not in self.ax.lines:
+            self.line, = self.ax.plot([], [], self.style, **self.kwargs)
+        import numpy as np
+        # A list of (x, y) pairs or an (N, 2) array
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if self.closed:
+            pts = np.concatenate((pts, pts[:1]))
+        self.line.set_data(pts[:, 0], pts[:, 1])
+
+
+class CanvasRenderer:
+    # Draws a TraceState on a Tk canvas, replacing the items tagged `tag`
+    def __init__(self, canvas, tag="trace", chain_color="green", test_color="black", edge_color="red", hull_color="red"):
+        self.canvas = canvas
+        self.tag = tag
+        self.chain_color = chain_color
+        self.test_color = test_color
+        self.edge_color = edge_color
+        self.hull_color = hull_color
+
+    def line(self, points, color):
+        if len(points) >= 2:
+            coords = [c for p in points for c in p]
+            self.canvas.create_line(*coords, tags=self.tag, fill=color, width=2)
+
+    def __call__(self, state):
+        self.canvas.delete(self.tag)
+        self.line(state.chain, self.chain_color)
+        self.line(state.test or [], self.test_color)
+        for edge in state.edges:
+            self.line(edge, self.edge_color)
+        if state.hull:
+            self.line(state.hull + state.hull[:1], self.hull_color)
@@ -0,0 +1,80 @@
+from itertools import islice
+
+import numpy as np
+
+import ArrayHull
+
+# Hull of point sets too large to hold in memory at once. Points arrive as an
+# iterable of (K, 2) chunks, and only the hull of the points seen so far is
+# kept between chunks: each chunk's hull is merged with it by one more
+# monotone chain over their union. Memory use is bounded by the chunk size
+# plus the hull size. The readers below produce chunks from a binary float64
+# file, through numpy.memmap, from a binary stream such as a pipe, or from CSV
+# text.
+
+DEFAULT_CHUNK = 1_000_000
+
+
+def hull_of_chunks(chunks):
+    # Returns the hull vertices as an (H, 2) array in ArrayHull order
+    hull = np.empty((0, 2))
+    for chunk in chunks:
+        pts = ArrayHull.as_point_array(chunk)
+        if len(pts) == 0:
+            continue
+        candidates = np.concatenate((hull, pts[ArrayHull.monotone_chain_indices(pts)]))
+        hull = candidates[ArrayHull.monotone_chain_indices(candidates)]
+    return hull
+
+
+def memmap_chunks(path, chunk_size=DEFAULT_CHUNK):
+    # A file of x, y float64 pairs in native byte order, as written by
+    # ndarray.tofile. Only the pages of the current chunk need to be resident.
+    data = np.memmap(path, dtype=np.float64, mode="r")
+    if len(data) % 2:
+        raise ValueError("%s holds an odd number of float64 values" % (path,))
+    pts = data.reshape(-1, 2)
+    for start in range(0, len(pts), chunk_size):
+        yield pts[start:start + chunk_size]
+
+
+def binary_chunks(stream, chunk_size=DEFAULT_CHUNK):
+    # The same format as memmap_chunks, read from a file object that need
+    # not support seeking, such as sys.stdin.buffer
+    size = 16 * chunk_size
+    pending = b""
+    while True:
+        data = stream.read(size - len(pending))
+        if not data:
+            break
+        pending += data
+        if len(pending) < size:
+            continue
+        yield np.frombuffer(pending, dtype=np.float64).reshape(-1, 2)
+        pending = b""
+    if len(pending) % 16:
+        raise ValueError("stream ended inside a point")
+    if pending:
+        yield np.frombuffer(pending, dtype=np.float64).reshape(-1, 2)
+
+
+def csv_chunks(lines, chunk_size=DEFAULT_CHUNK, skip_header=False):
+    # x, y rows from an open text file or any iterable of lines; further
+    # columns are ignored
+    lines = iter(lines)
+    if skip_header:
+        next(lines, None)
+    while True:
+        block = list(islice(lines, chunk_size))
+        if not block:
+            return
+        yield np.loadtxt(block, delimiter=",", usecols=(0, 1), ndmin=2)
+
+
+def memmap_hull(path, chunk_size=DEFAULT_CHUNK):
+    return hull_of_chunks(memmap_chunks(path, chunk_size))
+
+
+def csv_hull(path, chunk_size=DEFAULT_CHUNK, skip_header=False):
+    with open(path) as f:
+        return hull_of_chunks(csv_chunks(f, chunk_size, skip_header))
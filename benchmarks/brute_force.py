@@ -0,0 +1,34 @@
+import argparse
+
+import ArrayHull
+import ConvexHull
+import Datasets
+from benchmarks.monotone_chain import best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the brute force hull modes.")
+    parser.add_argument("-n", type=int, nargs="+", default=[200, 1_000, 3_000], help="numbers of points")
+    parser.add_argument("--all-pairs-max", type=int, default=300,
+                        help="largest N for the all-pairs (visualize) mode, which is O(n^3)")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for n in args.n:
+        pts = Datasets.points(args.dataset, n, args.seed)
+        point_list = [tuple(p) for p in pts.tolist()]
+
+        print("N = %d (%s)" % (n, args.dataset))
+        if n <= args.all_pairs_max:
+            seconds = best_time(lambda: ConvexHull.brute_force_edges(point_list, visualize=True), repeat=args.repeat)
+            print("  brute_force_edges, visualize=True   %8.3f s" % seconds)
+        seconds = best_time(ConvexHull.brute_force_convex_hull, point_list, repeat=args.repeat)
+        print("  brute_force_convex_hull             %8.3f s" % seconds)
+        seconds = best_time(ArrayHull.brute_force_indices, pts, repeat=args.repeat)
+        print("  ArrayHull.brute_force_indices       %8.3f s" % seconds)
+
+
+if __name__ == "__main__":
+    main()
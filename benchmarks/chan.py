@@ -0,0 +1,48 @@
+import argparse
+import math
+import random
+import time
+
+import ConvexHull
+
+COMPETITORS = ("chan", "jarvis_march", "graham_scan", "monotone_chain")
+
+
+def small_hull(rng, n):
+    # Uniform points in a square: the hull has O(log n) vertices
+    return [(rng.random(), rng.random()) for _ in range(n)]
+
+
+def large_hull(rng, n):
+    # Points on a circle: every point is a hull vertex
+    angles = [rng.random() * 2 * math.pi for _ in range(n)]
+    return [(math.cos(a), math.sin(a)) for a in angles]
+
+
+def timed(function, points):
+    start = time.perf_counter()
+    hull = function(points)
+    return time.perf_counter() - start, len(hull)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Chan's algorithm with Jarvis march and Graham scan.")
+    parser.add_argument("--small-h-n", type=int, default=1_000_000, help="number of points in the small-hull case")
+    parser.add_argument("--large-h-n", type=int, default=5_000, help="number of points in the large-hull case")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = [
+        ("small h (uniform square)", small_hull(rng, args.small_h_n)),
+        ("large h (circle)", large_hull(rng, args.large_h_n)),
+    ]
+    for name, points in cases:
+        print("%s, N = %d" % (name, len(points)))
+        for algorithm in COMPETITORS:
+            seconds, h = timed(ConvexHull.ALGORITHMS[algorithm], points)
+            print("  %-15s %8.3f s  h = %d" % (algorithm, seconds, h))
+
+
+if __name__ == "__main__":
+    main()
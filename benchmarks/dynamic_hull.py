@@ -0,0 +1,40 @@
+import argparse
+import time
+
+import ConvexHull
+import Datasets
+from DynamicHull import DynamicHull
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare incremental hull updates with recomputing the hull on every insert.")
+    parser.add_argument("-n", type=int, default=100_000, help="number of points inserted")
+    parser.add_argument("--recompute-n", type=int, default=2_000, help="number of points for the recompute baseline")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pts = [tuple(p) for p in Datasets.points(args.dataset, args.n, args.seed).tolist()]
+
+    hull = DynamicHull()
+    start = time.perf_counter()
+    for p in pts:
+        hull.insert(p)
+    dynamic_time = time.perf_counter() - start
+    assert hull.vertices() == ConvexHull.monotone_chain(pts)
+
+    seen = []
+    start = time.perf_counter()
+    for p in pts[:args.recompute_n]:
+        seen.append(p)
+        ConvexHull.monotone_chain(seen)
+    recompute_time = time.perf_counter() - start
+
+    print("N = %d (%s), h = %d" % (args.n, args.dataset, len(hull)))
+    print("  DynamicHull.insert          %8.2f us per point" % (1e6 * dynamic_time / args.n))
+    print("  monotone_chain per insert   %8.2f us per point (first %d points)" % (
+        1e6 * recompute_time / args.recompute_n, args.recompute_n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import time
+import tracemalloc
+
+import Datasets
+from Geometry import Point, SegmentArray
+
+
+class DictPoint:
+    # The per-object Point the intersection modules used to define
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def point_pairs(point_class):
+    def build(rows):
+        return [(point_class(x1, y1), point_class(x2, y2)) for x1, y1, x2, y2 in rows]
+    return build
+
+
+def tuples(rows):
+    return [tuple(row) for row in rows]
+
+
+def measure(build, data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(data)
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory used by the segment representations.")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of segments")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    segs = Datasets.segments("uniform", args.n, args.seed)
+    rows = segs.tolist()
+    representations = [
+        ("(DictPoint, DictPoint) list", point_pairs(DictPoint), rows),
+        ("(Point, Point) list", point_pairs(Point), rows),
+        ("4-tuple list", tuples, rows),
+        # Copied so the measurement includes the buffer; wrapping an existing
+        # float64 array costs nothing
+        ("SegmentArray", lambda data: SegmentArray(data.copy()), segs),
+    ]
+
+    print("N = %d segments" % args.n)
+    for name, build, data in representations:
+        size, seconds = measure(build, data)
+        print("  %-28s %8.1f MiB  %6.1f bytes/segment  built in %.2f s" % (
+            name, size / 2 ** 20, size / args.n, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+
+import ArrayHull
+import ConvexHull
+import Datasets
+from benchmarks.monotone_chain import best_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the atan2 and cross-product Graham scan sorts.")
+    parser.add_argument("-n", type=int, nargs="+", default=[100_000, 1_000_000], help="numbers of points")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for n in args.n:
+        pts = Datasets.points(args.dataset, n, args.seed)
+        point_list = [tuple(p) for p in pts.tolist()]
+
+        atan2_time = best_time(lambda: ConvexHull.graham_scan(point_list, exact=False), repeat=args.repeat)
+        exact_time = best_time(lambda: ConvexHull.graham_scan(point_list), repeat=args.repeat)
+        array_time = best_time(ArrayHull.graham_scan_indices, pts, repeat=args.repeat)
+
+        print("N = %d (%s)" % (n, args.dataset))
+        print("  graham_scan, atan2 key           %8.3f s" % atan2_time)
+        print("  graham_scan, cross product       %8.3f s  %5.1fx" % (exact_time, atan2_time / exact_time))
+        print("  ArrayHull.graham_scan_indices    %8.3f s  %5.1fx" % (array_time, atan2_time / array_time))
+
+
+if __name__ == "__main__":
+    main()
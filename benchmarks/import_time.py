@@ -0,0 +1,84 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Import cost of the modules, from python -X importtime in a fresh interpreter
+# per statement. The interpreter's own startup imports are measured once with
+# an empty statement and subtracted. Each row also lists which of the heavy
+# packages (matplotlib, numpy) the statement loaded: the GUI modules should
+# load neither until a window is created.
+
+STATEMENTS = {
+    "ConvexHull": "import ConvexHull",
+    "DynamicHull": "import DynamicHull",
+    "ArrayHull": "import ArrayHull",
+    "GrahamScan": "import GrahamScan",
+    "JarvisMarch": "import JarvisMarch",
+    "MonotoneChain": "import MonotoneChain",
+    "QuickHull": "import QuickHull",
+    "BruteForce": "import BruteForce",
+    "Lineintersection_ccw": "import Lineintersection_ccw",
+    "Registry.load_plugins": "import Registry; Registry.load_plugins()",
+    "cli": "import cli",
+}
+
+HEAVY = ("matplotlib", "numpy")
+
+# The statements import the modules from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_importtime(statement):
+    # Returns the summed cumulative time of the top-level imports in
+    # microseconds, and the top-level packages imported
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    total = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+        packages.add(name.strip().split(".")[0])
+    return total, packages
+
+
+def import_times(statements=STATEMENTS, repeat=3):
+    # One result per statement, with the best of repeat runs; statements
+    # that fail, e.g. for lack of tkinter, are reported with their error
+    baseline = min(run_importtime("pass")[0] for _ in range(repeat))
+    results = []
+    for label, statement in statements.items():
+        try:
+            runs = [run_importtime(statement) for _ in range(repeat)]
+        except RuntimeError as e:
+            results.append({"statement": label, "error": str(e)})
+            continue
+        total = min(t for t, _ in runs)
+        results.append({
+            "statement": label,
+            "seconds": (total - baseline) / 1e6,
+            "loads": sorted(p for p in HEAVY if p in runs[0][1]),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure module import times with python -X importtime.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for r in import_times(repeat=args.repeat):
+        if "error" in r:
+            print("%-24s %s" % (r["statement"], r["error"]))
+        else:
+            print("%-24s %8.1f ms  %s" % (r["statement"], 1e3 * r["seconds"], ", ".join(r["loads"]) or "-"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import time
+
+import numpy as np
+
+import ArrayHull
+import ConvexHull
+
+
+def best_time(function, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def original_monotone_chain(points):
+    # ConvexHullApp.monotone_chain from MonotoneChain.py before the hull
+    # algorithms moved out of the GUI, without its unused self
+    def orientation(p, q, r):
+        val = (q[1] - p[1]) * (r[0] - q[0]) - (q[0] - p[0]) * (r[1] - q[1])
+        return 0 if val == 0 else 1 if val > 0 else -1
+
+    points = sorted(set(points))
+
+    if len(points) < 3:
+        return points, points, points
+
+    def build_hull(points):
+        hull = []
+        for p in points:
+            while len(hull) >= 2 and orientation(hull[-2], hull[-1], p) != 1:
+                hull.pop()
+            hull.append(p)
+        return hull
+
+    lower_hull = build_hull(points)
+    upper_hull = build_hull(reversed(points))
+
+    return lower_hull[:-1] + upper_hull[:-1], upper_hull[:-1], lower_hull[:-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the original GUI, tuple-list and NumPy monotone chains.")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of points")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pts = np.random.default_rng(args.seed).random((args.n, 2))
+    point_list = [tuple(p) for p in pts.tolist()]
+
+    original_time = best_time(original_monotone_chain, point_list, repeat=args.repeat)
+    list_time = best_time(ConvexHull.monotone_chain, point_list, repeat=args.repeat)
+    array_time = best_time(ArrayHull.monotone_chain_indices, pts, repeat=args.repeat)
+
+    print("N = %d" % args.n)
+    print("original ConvexHullApp method    %8.3f s  %12.0f points/s" % (original_time, args.n / original_time))
+    print("ConvexHull.monotone_chain        %8.3f s  %12.0f points/s" % (list_time, args.n / list_time))
+    print("ArrayHull.monotone_chain_indices %8.3f s  %12.0f points/s" % (array_time, args.n / array_time))
+    print("speedup over the original        %8.1fx" % (original_time / array_time))
+
+
+if __name__ == "__main__":
+    main()
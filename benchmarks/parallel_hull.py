@@ -0,0 +1,42 @@
+import argparse
+import os
+import time
+
+import ArrayHull
+import Datasets
+import ParallelHull
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how the process-pool hull scales with the number of workers.")
+    parser.add_argument("-n", type=int, default=10_000_000, help="number of points")
+    parser.add_argument("--workers", type=int, nargs="+", default=None, help="worker counts (default 1 to the CPU count)")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workers = args.workers or list(range(1, (os.cpu_count() or 1) + 1))
+    pts = Datasets.points(args.dataset, args.n, args.seed)
+
+    def best(function):
+        seconds = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            function()
+            seconds = min(seconds, time.perf_counter() - start)
+        return seconds
+
+    serial = best(lambda: ArrayHull.monotone_chain_indices(pts))
+    print("N = %d (%s), %d CPUs" % (args.n, args.dataset, os.cpu_count() or 1))
+    print("  ArrayHull.monotone_chain_indices   %8.3f s" % serial)
+    for count in workers:
+        # Start the pool outside the timed runs, as a long-running caller would
+        with ParallelHull.make_executor(count) as executor:
+            executor.submit(int).result()
+            seconds = best(lambda: ParallelHull.parallel_hull_indices(pts, count, executor))
+        print("  parallel_hull_indices, %2d workers  %8.3f s  %5.2fx" % (count, seconds, serial / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import argparse
+import random
+
+import ConvexHull
+import Datasets
+import Predicates
+from benchmarks.monotone_chain import best_time
+
+
+def naive_cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def calls(function, triples):
+    for o, a, b in triples:
+        function(o, a, b)
+
+
+def fallback_rate(triples):
+    exact = 0
+    original = Predicates.orient_exact
+    def counting(o, a, b):
+        nonlocal exact
+        exact += 1
+        return original(o, a, b)
+    Predicates.orient_exact = counting
+    try:
+        calls(Predicates.orient, triples)
+    finally:
+        Predicates.orient_exact = original
+    return exact / len(triples)
+
+
+def near_collinear(rng, n):
+    # Triples on the line y = x / 3, which floats cannot represent exactly
+    triples = []
+    for _ in range(n):
+        xs = [rng.random() for _ in range(3)]
+        triples.append(tuple((x, x / 3) for x in xs))
+    return triples
+
+
+def alternating_times(function, *args, repeat=3):
+    # Best times with orient and with naive_cross, taking turns so that a
+    # slow spell of the machine does not land on one side only
+    robust_time = naive_time = float("inf")
+    for _ in range(repeat):
+        robust_time = min(robust_time, best_time(function, *args, repeat=1))
+        ConvexHull.cross = naive_cross
+        try:
+            naive_time = min(naive_time, best_time(function, *args, repeat=1))
+        finally:
+            ConvexHull.cross = Predicates.orient
+    return naive_time, robust_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cost of the adaptive orientation predicate.")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of orientation tests / points")
+    parser.add_argument("--hull-n", type=int, default=200_000, help="number of points for the hull algorithms")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    random_triples = [tuple((rng.random(), rng.random()) for _ in range(3)) for _ in range(args.n)]
+    collinear_triples = near_collinear(rng, args.n)
+
+    print("Orientation tests, N = %d" % args.n)
+    for name, triples in [("random", random_triples), ("near-collinear", collinear_triples)]:
+        naive_time = best_time(calls, naive_cross, triples, repeat=args.repeat)
+        robust_time = best_time(calls, Predicates.orient, triples, repeat=args.repeat)
+        print("  %-15s naive %7.3f s  orient %7.3f s  %5.2fx  exact fallback %6.2f%%" % (
+            name, naive_time, robust_time, robust_time / naive_time, 100 * fallback_rate(triples)))
+
+    pts = Datasets.points("uniform", args.hull_n, args.seed)
+    point_list = [tuple(p) for p in pts.tolist()]
+    print("Hull algorithms, N = %d (uniform)" % args.hull_n)
+    for name in ["monotone_chain", "graham_scan", "jarvis_march", "quick_hull"]:
+        function = getattr(ConvexHull, name)
+        naive_time, robust_time = alternating_times(function, point_list, repeat=args.repeat)
+        print("  %-15s naive %7.3f s  orient %7.3f s  %5.2fx" % (name, naive_time, robust_time, robust_time / naive_time))
+
+
+if __name__ == "__main__":
+    main()
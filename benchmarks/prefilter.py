@@ -0,0 +1,48 @@
+import argparse
+import time
+
+import numpy as np
+
+import ArrayHull
+import ConvexHull
+import Datasets
+
+DISTRIBUTIONS = {
+    "square": Datasets.uniform_square,
+    "disk": Datasets.uniform_disk,
+    "gaussian": Datasets.gaussian,
+}
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the Akl-Toussaint pre-filter.")
+    parser.add_argument("-n", type=int, default=100_000, help="number of points")
+    parser.add_argument("--brute-force-n", type=int, default=300, help="number of points for the brute force hull")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    for name, generate in DISTRIBUTIONS.items():
+        pts = generate(rng, args.n)
+        removed = 1 - np.count_nonzero(ArrayHull.akl_toussaint_mask(pts)) / args.n
+        print("%s: %.1f%% of %d points removed" % (name, 100 * removed, args.n))
+
+        for algorithm, hull_function in ConvexHull.ALGORITHMS.items():
+            n = args.brute_force_n if algorithm == "brute_force" else args.n
+            point_list = [tuple(p) for p in pts[:n].tolist()]
+            plain = timed(hull_function, point_list)
+            filtered = timed(hull_function, point_list, prefilter=True)
+            print("  %-15s n=%-8d %8.3f s -> %8.3f s  (%.1fx)" % (algorithm, n, plain, filtered, plain / filtered))
+        plain = timed(ArrayHull.monotone_chain_indices, pts)
+        filtered = timed(ArrayHull.monotone_chain_indices, pts, prefilter=True)
+        print("  %-15s n=%-8d %8.3f s -> %8.3f s  (%.1fx)" % ("array_monotone", args.n, plain, filtered, plain / filtered))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import argparse
+import math
+import random
+import time
+import tracemalloc
+
+import ConvexHull
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run QuickHull on points on a circle, where every point is a hull vertex.")
+    parser.add_argument("-n", type=int, default=1_000_000, help="number of points")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true", help="also measure peak memory (slow under tracemalloc)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    angles = [rng.random() * 2 * math.pi for _ in range(args.n)]
+    points = [(math.cos(a), math.sin(a)) for a in angles]
+
+    start = time.perf_counter()
+    hull = ConvexHull.quick_hull(points)
+    seconds = time.perf_counter() - start
+    print("N = %d, h = %d" % (args.n, len(hull)))
+    print("quick_hull  %8.3f s" % seconds)
+
+    if args.memory:
+        tracemalloc.start()
+        ConvexHull.quick_hull(points)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print("peak memory %.1f MB" % (peak / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main()
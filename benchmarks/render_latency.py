@@ -0,0 +1,68 @@
+import argparse
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+import Datasets
+from DynamicHull import DynamicHull
+from StepPlayer import AxesLine
+from benchmarks.monotone_chain import best_time
+
+# Time to handle one more click once n points are on the plot: the old GUIs
+# added a Line2D per point with ax.plot and redrew, so every click rendered n
+# artists; now one points artist and one hull artist are updated in place.
+# Both are timed with a full canvas.draw(), which is what draw_idle() does
+# once the GUI goes idle.
+
+
+def per_point_click(fig, ax, hull, p):
+    ax.plot(p[0], p[1], 'bo')
+    hull.insert(p)
+    fig.canvas.draw()
+
+
+def single_artist_click(fig, points, markers, hull, live_line, p):
+    points.append(p)
+    markers.set_points(points)
+    hull.insert(p)
+    live_line.set_points(hull.vertices())
+    fig.canvas.draw()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare redraw latency of an artist per point with single updated artists.")
+    parser.add_argument("-n", type=int, nargs="+", default=[100, 1_000, 10_000], help="points already plotted")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("%8s %16s %16s" % ("n", "artist per point", "single artist"))
+    for n in args.n:
+        pts = [tuple(p) for p in (10 * Datasets.points(args.dataset, n + 1, args.seed)).tolist()]
+        last = pts.pop()
+
+        fig, ax = plt.subplots()
+        hull = DynamicHull(pts)
+        for x, y in pts:
+            ax.plot(x, y, 'bo')
+        fig.canvas.draw()
+        old = best_time(per_point_click, fig, ax, hull, last, repeat=args.repeat)
+        plt.close(fig)
+
+        fig, ax = plt.subplots()
+        points = list(pts)
+        hull = DynamicHull(pts)
+        markers = AxesLine(ax, 'bo', label='Points')
+        live_line = AxesLine(ax, 'k:', closed=True)
+        markers.set_points(points)
+        fig.canvas.draw()
+        new = best_time(single_artist_click, fig, points, markers, hull, live_line, last, repeat=args.repeat)
+        plt.close(fig)
+
+        print("%8d %13.2f ms %13.2f ms" % (n, 1e3 * old, 1e3 * new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import time
+
+import numpy as np
+
+import Lineintersection_batch
+from Datasets import random_segments
+from Lineintersection_ccw import Point, intersect
+
+
+def python_pairs(segments):
+    lines = [(Point(x1, y1), Point(x2, y2)) for x1, y1, x2, y2 in segments.tolist()]
+    return [(i, j) for i in range(len(lines)) for j in range(i + 1, len(lines)) if intersect(lines[i], lines[j])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batched all-pairs intersection with a loop over intersect().")
+    parser.add_argument("-n", type=int, default=3000, help="number of segments")
+    parser.add_argument("--length", type=float, default=0.05, help="maximum half-extent of a segment")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    segments = random_segments(np.random.default_rng(args.seed), args.n, args.length)
+
+    start = time.perf_counter()
+    expected = python_pairs(segments)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs = Lineintersection_batch.intersecting_pairs(segments)
+    batch_time = time.perf_counter() - start
+
+    print("N = %d segments, %d pairs tested, %d intersecting" % (args.n, args.n * (args.n - 1) // 2, len(pairs)))
+    print("loop over intersect()         %8.3f s" % loop_time)
+    print("Lineintersection_batch        %8.3f s" % batch_time)
+    print("speedup                       %8.1fx" % (loop_time / batch_time))
+    if len(expected) != len(pairs):
+        print("warning: the loop found %d pairs" % len(expected))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import time
+from collections import deque
+
+import ArrayHull
+import ConvexHull
+import Datasets
+from DynamicHull import sliding_window
+
+
+def recompute(points, size):
+    # Baseline: rebuild the hull of the whole window on every tick after the
+    # first size points
+    window = deque(points[:size], maxlen=size)
+    for p in points[size:]:
+        window.append(p)
+        yield ConvexHull.monotone_chain(window)
+
+
+def recompute_array(pts, size):
+    for i in range(size, len(pts)):
+        yield ArrayHull.monotone_chain_indices(pts[i - size + 1:i + 1])
+
+
+def per_tick(hulls, ticks):
+    start = time.perf_counter()
+    for _ in hulls:
+        pass
+    return (time.perf_counter() - start) / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the fully dynamic hull with per-tick recomputation over a sliding window.")
+    parser.add_argument("--window", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="window sizes")
+    parser.add_argument("--ticks", type=int, default=2_000, help="ticks measured after the window has filled")
+    parser.add_argument("--dataset", choices=sorted(Datasets.POINTS), default="uniform")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.window:
+        pts = Datasets.points(args.dataset, size + args.ticks, args.seed)
+        point_list = [tuple(p) for p in pts.tolist()]
+
+        # Fill the window untimed, then time the ticks that follow
+        hulls = sliding_window(point_list, size)
+        for _ in range(size):
+            next(hulls)
+        dynamic = per_tick(hulls, args.ticks)
+
+        # Recomputing is slow for large windows, so fewer ticks are timed
+        ticks = min(args.ticks, max(10, 2_000_000 // size))
+        python = per_tick(recompute(point_list[:size + ticks], size), ticks)
+        numpy = per_tick(recompute_array(pts[:size + ticks], size), ticks)
+
+        print("window = %d (%s)" % (size, args.dataset))
+        print("  FullyDynamicHull              %9.3f ms per tick" % (1e3 * dynamic))
+        print("  ConvexHull.monotone_chain     %9.3f ms per tick  %6.1fx" % (1e3 * python, python / dynamic))
+        print("  ArrayHull.monotone_chain      %9.3f ms per tick  %6.1fx" % (1e3 * numpy, numpy / dynamic))
+
+
+if __name__ == "__main__":
+    main()
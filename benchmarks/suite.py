@@ -0,0 +1,195 @@
+import argparse
+import datetime
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import ArrayHull
+import ConvexHull
+import Datasets
+import Lineintersection_batch
+import Lineintersection_ccw
+import Lineintersection_grid
+import Lineintersection_parametric
+import Lineintersection_slope
+import Lineintersection_sweep
+from benchmarks.import_time import import_times
+
+# Runs every hull algorithm and every intersection routine over the generated
+# datasets in Datasets.py for growing N, and writes the results as JSON.
+# Larger sizes are skipped once a routine's run time, extrapolated from the
+# sizes already measured, would exceed the time budget.
+
+
+def point_list(pts):
+    return [tuple(p) for p in pts.tolist()]
+
+
+def segment_list(segs):
+    return [tuple(s) for s in segs.tolist()]
+
+
+def point_pairs(point_class):
+    def prepare(segs):
+        return [(point_class(x1, y1), point_class(x2, y2)) for x1, y1, x2, y2 in segs.tolist()]
+    return prepare
+
+
+def count_pairs(test):
+    # All-pairs loop over one of the interactive modules' predicates
+    def run(lines):
+        count = 0
+        for i, a in enumerate(lines):
+            for b in lines[i + 1:]:
+                if test(a, b):
+                    count += 1
+        return count
+    return run
+
+
+# name -> (input kind, prepare, run, worst-case growth exponent)
+HULLS = {name: ("points", point_list, function, 1.1) for name, function in ConvexHull.ALGORITHMS.items()}
+HULLS["brute_force"] = ("points", point_list, ConvexHull.brute_force_convex_hull, 3)
+HULLS["jarvis_march"] = ("points", point_list, ConvexHull.jarvis_march, 2)
+HULLS["quick_hull"] = ("points", point_list, ConvexHull.quick_hull, 2)
+HULLS["array_monotone_chain"] = ("points", np.asarray, ArrayHull.monotone_chain, 1.1)
+HULLS["array_brute_force"] = ("points", np.asarray, ArrayHull.brute_force, 3)
+
+INTERSECTIONS = {
+    "ccw": ("segments", point_pairs(Lineintersection_ccw.Point), count_pairs(Lineintersection_ccw.intersect), 2),
+    "parametric": ("segments", point_pairs(Lineintersection_parametric.Point), count_pairs(Lineintersection_parametric.parametric_intersect), 2),
+    "slope": ("segments", point_pairs(Lineintersection_slope.CustomPoint), count_pairs(Lineintersection_slope.check_intersection), 2),
+    "batch": ("segments", np.asarray, Lineintersection_batch.intersecting_pairs, 2),
+    "sweep": ("segments", segment_list, Lineintersection_sweep.intersecting_pairs, 1.2),
+    "grid": ("segments", segment_list, Lineintersection_grid.intersecting_pairs, 1.2),
+}
+
+ROUTINES = dict(HULLS, **INTERSECTIONS)
+
+DEFAULT_SIZES = [10 ** k for k in range(1, 8)]
+
+
+def output_size(result):
+    return result if isinstance(result, int) else len(result)
+
+
+def measure(run, data, repeat, memory):
+    # Best wall time over repeat runs, and the peak memory of one more run
+    # under tracemalloc, which would otherwise slow the timed runs down
+    seconds = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run(data)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run(data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak, output_size(result)
+
+
+def predicted_seconds(history, n, worst):
+    # Extrapolate from the last measured size with the growth observed between
+    # the last two, kept between linear and the routine's worst case
+    if not history:
+        return 0.0
+    last_n, last_seconds = history[-1]
+    exponent = worst
+    if len(history) >= 2:
+        prev_n, prev_seconds = history[-2]
+        if prev_seconds > 1e-3:
+            exponent = math.log(last_seconds / prev_seconds) / math.log(last_n / prev_n)
+            exponent = min(max(exponent, 1.0), worst)
+    return last_seconds * (n / last_n) ** exponent
+
+
+def run_suite(routines, datasets, sizes, budget, repeat=1, memory=True, seed=0, log=None):
+    results = []
+    skipped = []
+    for dataset in datasets:
+        history = {name: [] for name in routines}
+        for n in sizes:
+            inputs = {}
+            prepared = {}
+            for name in routines:
+                kind, prepare, run, worst = ROUTINES[name]
+                estimate = predicted_seconds(history[name], n, worst)
+                if estimate > budget:
+                    skipped.append({"routine": name, "dataset": dataset, "n": n, "predicted_seconds": estimate})
+                    continue
+
+                if kind not in inputs:
+                    generate = Datasets.points if kind == "points" else Datasets.segments
+                    inputs[kind] = generate(dataset, n, seed)
+                if (kind, prepare) not in prepared:
+                    prepared[kind, prepare] = prepare(inputs[kind])
+
+                seconds, peak, size = measure(run, prepared[kind, prepare], repeat, memory)
+                history[name].append((n, seconds))
+                results.append({
+                    "routine": name,
+                    "kind": "hull" if kind == "points" else "intersection",
+                    "dataset": dataset,
+                    "n": n,
+                    "seconds": seconds,
+                    "peak_bytes": peak,
+                    "ops_per_sec": n / seconds if seconds > 0 else None,
+                    "output_size": size,
+                })
+                if log is not None:
+                    print("%-12s %-22s n=%-9d %10.4f s  %s" % (
+                        dataset, name, n, seconds, "" if peak is None else "%.1f MiB" % (peak / 2 ** 20)), file=log)
+    return results, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every hull and intersection routine and write JSON results.")
+    parser.add_argument("--routines", nargs="+", choices=sorted(ROUTINES), default=list(ROUTINES))
+    parser.add_argument("--datasets", nargs="+", choices=sorted(Datasets.POINTS), default=list(Datasets.POINTS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="values of N, in increasing order")
+    parser.add_argument("--budget", type=float, default=5.0, help="skip runs predicted to take longer than this (seconds)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement; the best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--no-imports", action="store_true", help="skip measuring module import times")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="-", help="JSON output file, - for stdout")
+    args = parser.parse_args()
+
+    results, skipped = run_suite(args.routines, args.datasets, sorted(args.sizes), args.budget,
+                                 args.repeat, not args.no_memory, args.seed, log=sys.stderr)
+    report = {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "budget": args.budget,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    if not args.no_imports:
+        # Startup cost of each module, which the GUIs keep low by deferring
+        # matplotlib and numpy until a window is created
+        report["imports"] = import_times(repeat=args.repeat)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
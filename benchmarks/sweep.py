@@ -0,0 +1,52 @@
+import argparse
+import time
+
+import numpy as np
+
+import Lineintersection_batch
+import Lineintersection_grid
+import Lineintersection_sweep
+from Datasets import random_segments
+from benchmarks.segment_intersection import python_pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Bentley-Ottmann sweep and the grid index with all-pairs intersection on sparse inputs.")
+    parser.add_argument("-n", type=int, nargs="+", default=[1000, 4000, 16000], help="numbers of segments")
+    parser.add_argument("--length", type=float, default=0.002, help="maximum half-extent of a segment")
+    parser.add_argument("--loop-limit", type=int, default=4000, help="skip the Python all-pairs loop above this size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print("%8s %8s %12s %12s %12s %12s" % ("N", "k", "loop s", "batch s", "sweep s", "grid s"))
+    for n in args.n:
+        segments = random_segments(rng, n, args.length)
+
+        loop_time = float("nan")
+        if n <= args.loop_limit:
+            start = time.perf_counter()
+            python_pairs(segments)
+            loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = Lineintersection_batch.intersecting_pairs(segments)
+        batch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pairs = Lineintersection_sweep.intersecting_pairs(segments.tolist())
+        sweep_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        grid_pairs = Lineintersection_grid.intersecting_pairs(segments.tolist())
+        grid_time = time.perf_counter() - start
+
+        print("%8d %8d %12.3f %12.3f %12.3f %12.3f" % (n, len(pairs), loop_time, batch_time, sweep_time, grid_time))
+        if len(pairs) != len(expected):
+            print("warning: the batch test found %d pairs" % len(expected))
+        if grid_pairs != pairs:
+            print("warning: the grid index found %d pairs" % len(grid_pairs))
+
+
+if __name__ == "__main__":
+    main()
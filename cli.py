@@ -0,0 +1,181 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import ArrayHull
+import ConvexHull
+import Lineintersection_batch
+import Lineintersection_ccw
+import Lineintersection_grid
+import Lineintersection_parametric
+import Lineintersection_slope
+import Lineintersection_sweep
+from Datasets import load
+from Geometry import SegmentArray
+
+# Headless runner for the algorithms on index.py's menu, e.g.
+#
+#   python cli.py convex_hull graham_scan points.csv -o hull.csv
+#   python cli.py line_intersection sweep a.npy b.npy c.npy -o results/ -j 3
+#
+# Inputs are CSV (.csv, .txt, an optional header line is skipped), NumPy
+# (.npy) or raw native float64 values (any other extension), with x, y rows
+# for convex_hull and x1, y1, x2, y2 rows for line_intersection. A hull is
+# written as its vertices, counter-clockwise, and an intersection result as
+# the index pairs (i, j) of intersecting segments, in the format given by the
+# output's extension. With several inputs, -o names a directory, each result
+# is written under it at its input's path relative to the inputs' common
+# directory, and the jobs run in a pool of worker processes. An input that
+# cannot be loaded is reported by name and the others still run.
+
+
+def _hull(function):
+    def run(data):
+        return np.array(function([tuple(p) for p in data.tolist()]), dtype=np.float64).reshape(-1, 2)
+    return run
+
+
+def _array_hull(function):
+    def run(data):
+        return data[function(data)]
+    return run
+
+
+def _all_pairs(test):
+    # All-pairs loop over one of the interactive modules' predicates
+    def run(data):
+        segments = list(SegmentArray(data))
+        pairs = []
+        for i, a in enumerate(segments):
+            for j in range(i + 1, len(segments)):
+                if test(a, segments[j]):
+                    pairs.append((i, j))
+        return np.array(pairs, dtype=np.intp).reshape(-1, 2)
+    return run
+
+
+def _pairs(function):
+    def run(data):
+        return np.array(function(data), dtype=np.intp).reshape(-1, 2)
+    return run
+
+
+# algorithm -> (input columns, output header, {sub-algorithm: run})
+ALGORITHMS = {
+    "convex_hull": (2, "x,y", {
+        "brute_force": _hull(ConvexHull.brute_force_convex_hull),
+        "graham_scan": _hull(ConvexHull.graham_scan),
+        "jarvis_march": _hull(ConvexHull.jarvis_march),
+        "quick_hull": _hull(ConvexHull.quick_hull),
+        "monotone_chain": _hull(ConvexHull.monotone_chain),
+        "chan": _hull(ConvexHull.chan),
+        "array_monotone_chain": _array_hull(ArrayHull.monotone_chain_indices),
+        "array_brute_force": _array_hull(ArrayHull.brute_force_indices),
+    }),
+    "line_intersection": (4, "i,j", {
+        "parametric": _all_pairs(Lineintersection_parametric.parametric_intersect),
+        "slope": _all_pairs(Lineintersection_slope.check_intersection),
+        "ccw": _all_pairs(Lineintersection_ccw.intersect),
+        "batch": _pairs(Lineintersection_batch.intersecting_pairs),
+        "sweep": _pairs(Lineintersection_sweep.intersecting_pairs),
+        "grid": _pairs(Lineintersection_grid.intersecting_pairs),
+    }),
+}
+
+
+def sub_algorithm_name(name):
+    # Accept the menu's labels too, e.g. "Graham Scan" or "CCW"
+    return name.strip().lower().replace(" ", "_")
+
+
+def save(path, result, header):
+    ext = os.path.splitext(path)[1].lower()
+    fmt = "%d" if result.dtype.kind == "i" else "%.17g"
+    if path == "-":
+        np.savetxt(sys.stdout, result, fmt=fmt, delimiter=",", header=header, comments="")
+    elif ext == ".npy":
+        np.save(path, result)
+    elif ext in (".csv", ".txt"):
+        np.savetxt(path, result, fmt=fmt, delimiter=",", header=header, comments="")
+    else:
+        result.tofile(path)
+
+
+def run_job(algorithm, sub_algorithm, input_path, output_path):
+    columns, header, runs = ALGORITHMS[algorithm]
+    try:
+        data = load(input_path, columns)
+    except (OSError, ValueError) as e:
+        message = str(e)
+        if not message.startswith(input_path):
+            message = "%s: %s" % (input_path, message)
+        return False, message
+    start = time.perf_counter()
+    result = runs[sub_algorithm](data)
+    seconds = time.perf_counter() - start
+    save(output_path, result, header)
+    return True, "%s: %d rows -> %d rows in %.3f s" % (input_path, len(data), len(result), seconds)
+
+
+def output_paths(inputs, output, sub_algorithm):
+    if len(inputs) == 1:
+        return [output]
+    # Relative to the common directory, so a/pts.csv and b/pts.csv are
+    # written to output/a/ and output/b/ instead of the same file
+    common = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in inputs])
+    paths = []
+    for path in inputs:
+        stem, ext = os.path.splitext(os.path.relpath(os.path.abspath(path), common))
+        paths.append(os.path.join(output, "%s.%s%s" % (stem, sub_algorithm, ext or ".bin")))
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a hull or segment intersection algorithm on point or segment files.")
+    parser.add_argument("algorithm", choices=sorted(ALGORITHMS))
+    parser.add_argument("sub_algorithm", type=sub_algorithm_name)
+    parser.add_argument("inputs", nargs="+", help="CSV, .npy or raw float64 files")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file (- for CSV on stdout), or a directory when there are several inputs")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for several inputs")
+    args = parser.parse_args(argv)
+
+    runs = ALGORITHMS[args.algorithm][2]
+    if args.sub_algorithm not in runs:
+        parser.error("unknown %s algorithm %r (choose from %s)" % (
+            args.algorithm, args.sub_algorithm, ", ".join(sorted(runs))))
+    for path in args.inputs:
+        if not os.path.isfile(path):
+            parser.error("no such input file: %s" % path)
+    many = len(args.inputs) > 1
+    if many and args.output == "-":
+        parser.error("-o must name a directory when there are several inputs")
+    outputs = output_paths(args.inputs, args.output, args.sub_algorithm)
+    written = {}
+    for path, out in zip(args.inputs, outputs):
+        if out in written:
+            parser.error("%s and %s would both be written to %s" % (written[out], path, out))
+        written[out] = path
+    if many:
+        for out in outputs:
+            os.makedirs(os.path.dirname(out), exist_ok=True)
+
+    jobs = [(args.algorithm, args.sub_algorithm, path, out) for path, out in zip(args.inputs, outputs)]
+    if many and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(run_job, *zip(*jobs)))
+    else:
+        results = [run_job(*job) for job in jobs]
+
+    for ok, message in results:
+        print(message, file=sys.stderr)
+    if not all(ok for ok, message in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
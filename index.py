@@ -1,13 +1,16 @@
 import tkinter as tk
 from tkinter import ttk
 from ttkthemes import ThemedStyle
-import subprocess
+import Registry
 
 class AlgorithmRunnerApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Algorithm Runner")
 
+        # The visualizer modules register themselves when imported
+        Registry.load_plugins()
+
         style = ThemedStyle(self.root)
         style.set_theme("plastik")
 
@@ -25,7 +28,7 @@ class AlgorithmRunnerApp:
         algorithm_label = ttk.Label(main_frame, text="Select Algorithm:")
         algorithm_label.grid(row=0, column=0, pady=10, sticky=tk.W)
 
-        algorithm_combobox = ttk.Combobox(main_frame, values=["convex_hull", "line_intersection"], textvariable=self.algorithm_var, state="readonly")
+        algorithm_combobox = ttk.Combobox(main_frame, values=Registry.algorithms(), textvariable=self.algorithm_var, state="readonly")
         algorithm_combobox.grid(row=0, column=1, pady=10, padx=10, sticky=tk.W)
 
         # Sub-Algorithm Label and Combobox
@@ -43,14 +46,7 @@ class AlgorithmRunnerApp:
         algorithm_combobox.bind("<<ComboboxSelected>>", self.update_sub_algorithms)
 
     def update_sub_algorithms(self, event):
-        main_choice = self.algorithm_var.get()
-
-        if main_choice == "convex_hull":
-            sub_algorithms = ["Brute Force", "Graham Scan", "Jarvis March", "Quick Hull","Monotone Chain"]
-        elif main_choice == "line_intersection":
-            sub_algorithms = ["Parametric", "Slope", "CCW"]
-        else:
-            sub_algorithms = []
+        sub_algorithms = Registry.names(self.algorithm_var.get())
 
         self.sub_algorithm_var.set("")  # Reset sub-algorithm choice
         self.sub_algorithm_combobox["values"] = sub_algorithms
@@ -58,31 +54,13 @@ class AlgorithmRunnerApp:
     def run_algorithm(self):
         main_choice = self.algorithm_var.get()
         sub_choice = self.sub_algorithm_var.get()
+        if not main_choice or not sub_choice:
+            return
 
-        if main_choice == "convex_hull":
-            self.run_convex_hull(sub_choice)
-        elif main_choice == "line_intersection":
-            self.run_line_intersection(sub_choice)
-
-    def run_convex_hull(self, sub_algorithm):
-        if sub_algorithm == "Brute Force":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/BruteForce.py"])
-        elif sub_algorithm == "Graham Scan":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/GrahamScan.py"])
-        elif sub_algorithm == "Jarvis March":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/JarvisMarch.py"])
-        elif sub_algorithm == "Quick Hull":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/QuickHull.py"])
-        elif sub_algorithm == "Monotone Chain":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/MonotoneChain.py"])
-            
-    def run_line_intersection(self, sub_algorithm):
-        if sub_algorithm == "Parametric":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/Lineintersection_parametric.py"])
-        elif sub_algorithm == "Slope":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/Lineintersection_slope.py"])
-        elif sub_algorithm == "CCW":
-            subprocess.run(["python", "D:/Documents/University/Fall_23/Algorithms Project/alpha_algo/Lineintersection_ccw.py"])
+        # Each visualizer opens in its own window in this process, so the
+        # modules and their imports are loaded once and reused
+        window = tk.Toplevel(self.root)
+        Registry.open_window(main_choice, sub_choice, window)
 
 if __name__ == "__main__":
     root = tk.Tk()
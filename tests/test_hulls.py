@@ -0,0 +1,115 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import ConvexHull
+from DynamicHull import DynamicHull, FullyDynamicHull
+
+# Every hull algorithm must return the hull an exact monotone chain in
+# Fractions gives for the same points: counter-clockwise from the
+# lexicographically smallest point, without duplicates or collinear edge
+# points, and sorted when fewer than three distinct points remain.
+
+
+def exact_orient(o, a, b):
+    o, a, b = [(Fraction(p[0]), Fraction(p[1])) for p in (o, a, b)]
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def exact_hull(points):
+    pts = sorted(set(points))
+    if len(pts) < 3:
+        return pts
+
+    def chain(ordered):
+        hull = []
+        for p in ordered:
+            while len(hull) >= 2 and exact_orient(hull[-2], hull[-1], p) <= 0:
+                hull.pop()
+            hull.append(p)
+        return hull
+
+    lower, upper = chain(pts), chain(reversed(pts))
+    return lower[:-1] + upper[:-1]
+
+
+DEGENERATE = [
+    [],
+    [(1.0, 2.0)],
+    [(1.0, 2.0), (1.0, 2.0)],
+    [(3.0, 1.0), (1.0, 2.0)],
+    [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0), (3.0, 3.0)],
+    [(0.0, 0.0), (0.0, 1.0), (0.0, 2.0), (0.0, 1.0)],
+    [(0.0, 0.0), (2.0, 0.0), (1.0, 0.0), (2.0, 2.0), (0.0, 2.0), (1.0, 2.0), (1.0, 1.0)],
+    [(0, 0), (1e-200, 1e-200), (1e-200, 2e-200), (0, 1e-200)],
+]
+
+
+def random_cases(seed, count=40):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(3, 40)
+        yield [(float(rng.randint(0, 5)), float(rng.randint(0, 5))) for _ in range(n)]
+        yield [(rng.random(), rng.random()) for _ in range(n)]
+        # Nearly collinear: on the line y = x / 3, which floats miss
+        yield [(x, x / 3) for x in (rng.random() for _ in range(n))]
+        # Small integer grids scaled until the float products underflow
+        for scale in (1e-170, 1e-310):
+            yield [(rng.randint(0, 10) * scale, rng.randint(0, 10) * scale) for _ in range(n)]
+
+
+def cases(seed=0, count=40):
+    return DEGENERATE + list(random_cases(seed, count))
+
+
+@pytest.mark.parametrize("name", sorted(ConvexHull.ALGORITHMS))
+def test_algorithms_match_exact_hull(name):
+    function = ConvexHull.ALGORITHMS[name]
+    for points in cases():
+        assert function(points) == exact_hull(points), points
+
+
+def test_polar_sort_without_exact_keys_on_integers():
+    # atan2 keys can only go wrong for nearly collinear points
+    for points in random_cases(1):
+        if all(x == int(x) for p in points for x in p):
+            assert ConvexHull.graham_scan(points, exact=False) == exact_hull(points), points
+
+
+@pytest.mark.parametrize("name", ["graham_scan", "jarvis_march", "quick_hull", "monotone_chain", "chan"])
+def test_stats_do_not_change_the_hull(name):
+    function = ConvexHull.ALGORITHMS[name]
+    for points in random_cases(2, count=10):
+        assert function(points, stats=ConvexHull.HullStats()) == exact_hull(points), points
+
+
+@pytest.mark.parametrize("name", ["brute_force_indices", "graham_scan_indices", "monotone_chain_indices"])
+def test_array_hulls_match_exact_hull(name):
+    np = pytest.importorskip("numpy")
+    import ArrayHull
+    function = getattr(ArrayHull, name)
+    for points in cases():
+        pts = np.array(points, dtype=np.float64).reshape(-1, 2)
+        assert [tuple(p) for p in pts[function(pts)].tolist()] == exact_hull(points), points
+
+
+def test_dynamic_hull_matches_exact_hull():
+    # Checked after every insertion, so on fewer inputs
+    for points in cases(4, count=10):
+        hull = DynamicHull()
+        for i, p in enumerate(points):
+            hull.insert(p)
+            assert hull.vertices() == exact_hull(points[:i + 1]), points[:i + 1]
+
+
+def test_fully_dynamic_hull_matches_exact_hull_after_deletions():
+    rng = random.Random(3)
+    for points in cases(5, count=10):
+        hull = FullyDynamicHull(points)
+        assert hull.vertices() == exact_hull(points), points
+        remaining = list(points)
+        rng.shuffle(remaining)
+        while remaining:
+            hull.delete(remaining.pop())
+            assert hull.vertices() == exact_hull(remaining), remaining
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The GUI modules defer matplotlib and numpy until a window is created, so
+# importing them, or loading every visualizer through the registry, must not
+# pull either package in. Each check runs in a fresh interpreter.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("tkinter")
+
+
+def loaded_packages(statement):
+    code = statement + "; import sys; print(' '.join(p for p in ('matplotlib', 'numpy') if p in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()
+
+
+def test_gui_modules_import_without_matplotlib_or_numpy():
+    assert loaded_packages("import HullApp, GrahamScan, JarvisMarch, MonotoneChain, QuickHull, BruteForce, Registry") == []
+
+
+def test_load_plugins_imports_without_matplotlib_or_numpy():
+    assert loaded_packages("import Registry; Registry.load_plugins()") == []
@@ -0,0 +1,85 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import Lineintersection_grid
+import Lineintersection_sweep
+
+# Every segment intersection engine must report the same pairs as an exact
+# all-pairs test in Fractions, also where float products underflow.
+
+
+def exact_orient(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def straddles(d1, d2):
+    # The two points are not strictly on the same side of the line
+    return d1 == 0 or d2 == 0 or (d1 > 0) != (d2 > 0)
+
+
+def exact_intersect(s, t):
+    a, b, c, d = [(Fraction(p[0]), Fraction(p[1])) for p in ((s[0], s[1]), (s[2], s[3]), (t[0], t[1]), (t[2], t[3]))]
+    d1, d2, d3, d4 = exact_orient(a, b, c), exact_orient(a, b, d), exact_orient(c, d, a), exact_orient(c, d, b)
+    if d1 == d2 == d3 == d4 == 0:
+        # Collinear: they meet if their extents overlap on both axes
+        return all(max(min(s[k], s[k + 2]), min(t[k], t[k + 2])) <= min(max(s[k], s[k + 2]), max(t[k], t[k + 2])) for k in (0, 1))
+    return straddles(d1, d2) and straddles(d3, d4)
+
+
+def exact_pairs(segments):
+    return [(i, j) for i in range(len(segments)) for j in range(i + 1, len(segments)) if exact_intersect(segments[i], segments[j])]
+
+
+def engines():
+    result = [Lineintersection_grid.intersecting_pairs, Lineintersection_sweep.intersecting_pairs]
+    try:
+        import Lineintersection_batch
+    except ImportError:
+        return result
+    return result + [lambda segments: [tuple(p) for p in Lineintersection_batch.intersecting_pairs(segments).tolist()]]
+
+
+def random_cases():
+    rng = random.Random(0)
+    for _ in range(60):
+        n = rng.randint(2, 25)
+        yield [tuple(float(rng.randint(0, 6)) for _ in range(4)) for _ in range(n)]
+        yield [tuple(rng.random() for _ in range(4)) for _ in range(n)]
+        # A small integer grid scaled far below the normal float range
+        yield [tuple(rng.randint(0, 6) * 1e-160 for _ in range(4)) for _ in range(n)]
+
+
+@pytest.mark.parametrize("engine", engines())
+def test_tiny_segments_that_miss(engine):
+    assert engine([(0, 0, 2e-100, 2e-100), (0, 1e-100, 1e-100, 2e-100)]) == []
+
+
+@pytest.mark.parametrize("engine", engines())
+def test_engines_match_exact_pairs(engine):
+    for segments in random_cases():
+        assert engine(segments) == exact_pairs(segments), segments
+
+
+
+def test_grid_with_long_segments():
+    # Tiny segments, some crossing the lines y = 0.3 + 0.4 x and y = 1 - x,
+    # and segments across the whole square among them
+    rng = random.Random(1)
+    tiny = []
+    for _ in range(300):
+        x = rng.random()
+        y = rng.choice([0.3 + 0.4 * x, 1 - x, rng.random()])
+        tiny.append((x, y - 1e-6, x, y + 1e-6))
+    grid = Lineintersection_grid.SegmentGrid(tiny)
+    query = (0.0, 0.3, 1.0, 0.7)
+    assert grid.is_long(Lineintersection_grid.as_segment(query))
+    assert grid.intersecting(query) == [i for i, t in enumerate(tiny) if exact_intersect(query, t)]
+
+    stored = tiny + [(0.0, 1.0, 1.0, 0.0), query]
+    keys = [grid.insert(s) for s in stored[len(tiny):]]
+    for s in stored[:30] + stored[len(tiny):]:
+        assert grid.intersecting(s) == [i for i, t in enumerate(stored) if exact_intersect(s, t)]
+    grid.delete(keys[0])
+    assert grid.intersecting(query) == [i for i, t in enumerate(stored) if i != keys[0] and exact_intersect(query, t)]
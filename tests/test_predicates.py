@@ -0,0 +1,58 @@
+import random
+from fractions import Fraction
+
+import pytest
+
+import Predicates
+
+# Predicates.orient must have the sign of the exact cross product, computed
+# here in Fractions, for every input: random, nearly collinear, exactly
+# collinear, and scaled so far down that the float products underflow.
+
+
+def exact_sign(o, a, b):
+    o, a, b = [(Fraction(p[0]), Fraction(p[1])) for p in (o, a, b)]
+    det = (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    return (det > 0) - (det < 0)
+
+
+def sign(value):
+    return (value > 0) - (value < 0)
+
+
+def triples(seed, n=2000):
+    rng = random.Random(seed)
+    for _ in range(n):
+        kind = rng.randrange(5)
+        if kind == 0:
+            yield tuple((rng.random(), rng.random()) for _ in range(3))
+        elif kind == 1:
+            # Nearly collinear: on the line y = x / 3, which floats miss
+            xs = [rng.random() for _ in range(3)]
+            yield tuple((x, x / 3) for x in xs)
+        elif kind == 2:
+            yield tuple((float(rng.randint(0, 3)), float(rng.randint(0, 3))) for _ in range(3))
+        else:
+            # Small integer grids scaled below the normal range, or to where
+            # only the products underflow
+            scale = 1e-170 if kind == 3 else 1e-310
+            yield tuple((rng.randint(0, 4) * scale, rng.randint(0, 4) * scale) for _ in range(3))
+
+
+def test_underflowing_products():
+    assert Predicates.orient((0, 0), (1e-200, 1e-200), (1e-200, 2e-200)) > 0
+    assert Predicates.orient((0.0, 0.0), (1e-200, 2e-200), (1e-200, 1e-200)) < 0
+    assert Predicates.orient((0.0, 0.0), (1e-200, 1e-200), (2e-200, 2e-200)) == 0
+
+
+def test_orient_matches_exact_sign():
+    for o, a, b in triples(0):
+        assert sign(Predicates.orient(o, a, b)) == exact_sign(o, a, b), (o, a, b)
+
+
+def test_orient_arrays_matches_exact_sign():
+    np = pytest.importorskip("numpy")
+    cases = list(triples(1))
+    coords = np.array([[c for p in t for c in p] for t in cases])
+    det = Predicates.orient_arrays(*coords.T)
+    assert [sign(d) for d in det.tolist()] == [exact_sign(*t) for t in cases]